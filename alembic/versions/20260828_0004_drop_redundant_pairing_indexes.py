@@ -0,0 +1,35 @@
+"""Drop redundant pairing indexes
+
+Revision ID: 20260828_0004
+Revises: 20260205_0003
+Create Date: 2026-08-28
+
+ix_pairings_tournament_round is fully covered by the leftmost prefix of
+ix_pairings_tournament_round_board, and the single-column round_number
+index is never queried without a tournament filter. Dropping both halves
+the number of b-trees each pairing INSERT/UPDATE has to maintain.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260828_0004'
+down_revision: Union[str, None] = '20260205_0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_pairings_tournament_round', table_name='pairings')
+    op.drop_index('ix_pairings_round_number', table_name='pairings')
+
+
+def downgrade() -> None:
+    op.create_index('ix_pairings_round_number', 'pairings', ['round_number'])
+    op.create_index(
+        'ix_pairings_tournament_round', 'pairings',
+        ['tournament_id', 'round_number'],
+    )
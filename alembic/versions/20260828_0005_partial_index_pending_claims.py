@@ -0,0 +1,39 @@
+"""Make ix_pairings_claimed a partial index over pending claims
+
+Revision ID: 20260828_0005
+Revises: 20260828_0004
+Create Date: 2026-08-28
+
+The confirmation-polling query only looks at rows with an undisputed
+open claim; indexing every pairing (claimed_result is NULL for almost
+all of them) just wasted cache. The partial form is O(pending claims)
+instead of O(all pairings).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260828_0005'
+down_revision: Union[str, None] = '20260828_0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_pairings_claimed', table_name='pairings')
+    op.create_index(
+        'ix_pairings_claimed', 'pairings',
+        ['tournament_id', 'claimed_at'],
+        sqlite_where=sa.text('claimed_result IS NOT NULL AND is_disputed = 0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pairings_claimed', table_name='pairings')
+    op.create_index(
+        'ix_pairings_claimed', 'pairings',
+        ['tournament_id', 'claimed_result', 'is_disputed'],
+    )
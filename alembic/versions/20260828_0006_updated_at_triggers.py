@@ -0,0 +1,41 @@
+"""Maintain updated_at with AFTER UPDATE triggers
+
+Revision ID: 20260828_0006
+Revises: 20260828_0005
+Create Date: 2026-08-28
+
+The ORM-side onupdate=datetime.utcnow callbacks only fired for ORM
+updates; bulk and raw-SQL UPDATE statements left updated_at stale.
+SQLite has no ON UPDATE clause, so each table with the column gets an
+AFTER UPDATE trigger instead. The WHEN guard skips rows where the
+statement already set updated_at explicitly.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260828_0006'
+down_revision: Union[str, None] = '20260828_0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ['clubs', 'pairings', 'players', 'tournaments', 'shared_device_alerts']
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS trg_{table}_updated_at "
+            f"AFTER UPDATE ON {table} FOR EACH ROW "
+            f"WHEN NEW.updated_at = OLD.updated_at "
+            f"BEGIN UPDATE {table} SET updated_at = CURRENT_TIMESTAMP "
+            f"WHERE rowid = NEW.rowid; END"
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at")
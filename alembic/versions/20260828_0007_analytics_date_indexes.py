@@ -0,0 +1,40 @@
+"""Expression indexes for the analytics date groupings
+
+Revision ID: 20260828_0007
+Revises: 20260828_0006
+Create Date: 2026-08-28
+
+The time-series endpoints group by date(created_at) / date(played_at);
+wrapping the column in date() means the plain datetime indexes cannot
+serve the grouping. Expression indexes on the date() form let SQLite
+aggregate from the index alone. The pairings one is also partial, since
+the query only ever looks at played games.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260828_0007'
+down_revision: Union[str, None] = '20260828_0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_players_created_date', 'players',
+        [sa.text('date(created_at)')],
+    )
+    op.create_index(
+        'ix_pairings_played_date', 'pairings',
+        [sa.text('date(played_at)')],
+        sqlite_where=sa.text('played_at IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pairings_played_date', table_name='pairings')
+    op.drop_index('ix_players_created_date', table_name='players')
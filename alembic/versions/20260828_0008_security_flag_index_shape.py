@@ -0,0 +1,37 @@
+"""Replace security_flags status/severity indexes with one composite
+
+Revision ID: 20260828_0008
+Revises: 20260828_0007
+Create Date: 2026-08-28
+
+The dashboard queries filter WHERE status = 'open' (count) and
+WHERE status = 'open' AND severity IN ('high', 'critical'); a single
+(status, severity) composite serves both via its leftmost prefix, so the
+two standalone indexes were pure write/cache overhead.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260828_0008'
+down_revision: Union[str, None] = '20260828_0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_security_flags_severity', table_name='security_flags')
+    op.drop_index('ix_security_flags_status', table_name='security_flags')
+    op.create_index(
+        'ix_security_flags_status_severity', 'security_flags',
+        ['status', 'severity'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_security_flags_status_severity', table_name='security_flags')
+    op.create_index('ix_security_flags_status', 'security_flags', ['status'])
+    op.create_index('ix_security_flags_severity', 'security_flags', ['severity'])
@@ -0,0 +1,43 @@
+"""Ordered partial standings index for tournament_players
+
+Revision ID: 20260828_0009
+Revises: 20260828_0008
+Create Date: 2026-08-28
+
+Standings always exclude withdrawn players and sort by score then the
+tiebreaks, all descending. An index matching that exact shape lets the
+standings query walk the index in display order instead of sorting;
+the partial final_rank index covers completed tournaments' frozen
+leaderboards.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260828_0009'
+down_revision: Union[str, None] = '20260828_0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_tp_tournament_score', table_name='tournament_players')
+    op.create_index(
+        'ix_tp_standings', 'tournament_players',
+        ['tournament_id', sa.text('score DESC'), sa.text('buchholz DESC'), sa.text('sonneborn_berger DESC')],
+        sqlite_where=sa.text('is_withdrawn = 0'),
+    )
+    op.create_index(
+        'ix_tp_final_rank', 'tournament_players',
+        ['tournament_id', 'final_rank'],
+        sqlite_where=sa.text('final_rank IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tp_final_rank', table_name='tournament_players')
+    op.drop_index('ix_tp_standings', table_name='tournament_players')
+    op.create_index('ix_tp_tournament_score', 'tournament_players', ['tournament_id', 'score'])
@@ -0,0 +1,34 @@
+"""Store tournament restriction lists as JSON columns
+
+Revision ID: 20260828_0010
+Revises: 20260828_0009
+Create Date: 2026-08-28
+
+county_restrictions / allowed_clubs were Text holding JSON strings that
+get_/set_ helpers re-parsed on every eligibility check. As JSON columns
+the ORM parses once at row hydration and the attribute is the list
+itself. SQLite stores JSON as TEXT, so existing rows are read unchanged.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260828_0010'
+down_revision: Union[str, None] = '20260828_0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('tournaments') as batch_op:
+        batch_op.alter_column('county_restrictions', type_=sa.JSON(), existing_type=sa.Text())
+        batch_op.alter_column('allowed_clubs', type_=sa.JSON(), existing_type=sa.Text())
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('tournaments') as batch_op:
+        batch_op.alter_column('county_restrictions', type_=sa.Text(), existing_type=sa.JSON())
+        batch_op.alter_column('allowed_clubs', type_=sa.Text(), existing_type=sa.JSON())
@@ -0,0 +1,32 @@
+"""Store SharedDeviceAlert.player_ids as a JSON column
+
+Revision ID: 20260828_0011
+Revises: 20260828_0010
+Create Date: 2026-08-28
+
+Same treatment as the tournament restriction lists: the Text column held
+a JSON string that every consumer re-parsed. As a JSON column the ORM
+parses once at hydration. SQLite stores JSON as TEXT, so existing rows
+read unchanged.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260828_0011'
+down_revision: Union[str, None] = '20260828_0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('shared_device_alerts') as batch_op:
+        batch_op.alter_column('player_ids', type_=sa.JSON(), existing_type=sa.Text())
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('shared_device_alerts') as batch_op:
+        batch_op.alter_column('player_ids', type_=sa.Text(), existing_type=sa.JSON())
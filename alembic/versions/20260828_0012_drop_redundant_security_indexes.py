@@ -0,0 +1,34 @@
+"""Drop single-column indexes shadowed by composites
+
+Revision ID: 20260828_0012
+Revises: 20260828_0011
+Create Date: 2026-08-28
+
+ix_device_fingerprints_player_id duplicates the leading column of the
+unique (player_id, fingerprint_hash) composite, and the auto-created
+login_history.player_id index duplicates the leading column of
+ix_login_history_player_created. The planner serves player_id-only
+lookups from the composites' leftmost prefix, so both standalone
+indexes were pure insert/disk overhead.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260828_0012'
+down_revision: Union[str, None] = '20260828_0011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_device_fingerprints_player_id', table_name='device_fingerprints')
+    op.drop_index('ix_login_history_player_id', table_name='login_history')
+
+
+def downgrade() -> None:
+    op.create_index('ix_login_history_player_id', 'login_history', ['player_id'])
+    op.create_index('ix_device_fingerprints_player_id', 'device_fingerprints', ['player_id'])
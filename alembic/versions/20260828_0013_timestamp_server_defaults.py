@@ -0,0 +1,47 @@
+"""Server-side defaults for the remaining timestamp columns
+
+Revision ID: 20260828_0013
+Revises: 20260828_0012
+Create Date: 2026-08-28
+
+Rows created through Core bulk INSERTs (which skip Python-side column
+defaults) now get their timestamps from the database, matching the
+TimestampMixin tables.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260828_0013'
+down_revision: Union[str, None] = '20260828_0012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = [
+    ('login_history', 'created_at'),
+    ('security_flags', 'created_at'),
+    ('otps', 'created_at'),
+    ('notifications', 'created_at'),
+    ('device_fingerprints', 'last_seen_at'),
+    ('device_fingerprints', 'first_seen_at'),
+    ('tournament_players', 'joined_at'),
+]
+
+
+def upgrade() -> None:
+    for table, column in COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column, existing_type=sa.DateTime(), server_default=sa.func.now()
+            )
+
+
+def downgrade() -> None:
+    for table, column in COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column, existing_type=sa.DateTime(), server_default=None
+            )
@@ -0,0 +1,28 @@
+"""Add players.avatar_checked_at for TTL-gated avatar refresh
+
+Revision ID: 20260828_0014
+Revises: 20260828_0013
+Create Date: 2026-08-28
+
+Lets /login skip the Chess.com profile call unless the avatar hasn't
+been checked for a day.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260828_0014'
+down_revision: Union[str, None] = '20260828_0013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('players', sa.Column('avatar_checked_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('players', 'avatar_checked_at')
@@ -0,0 +1,39 @@
+"""Extend notifications (player_id, created_at) index with an id tiebreak
+
+Revision ID: 20260828_0015
+Revises: 20260828_0014
+Create Date: 2026-08-28
+
+Keyset pagination on /api/notifications seeks to an exact
+(created_at, id) position, so the listing index needs both columns
+after player_id.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260828_0015'
+down_revision: Union[str, None] = '20260828_0014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_notifications_player_created', table_name='notifications')
+    op.create_index(
+        'ix_notifications_player_created',
+        'notifications',
+        ['player_id', sa.text('created_at DESC'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_player_created', table_name='notifications')
+    op.create_index(
+        'ix_notifications_player_created',
+        'notifications',
+        ['player_id', 'created_at'],
+    )
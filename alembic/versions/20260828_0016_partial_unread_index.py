@@ -0,0 +1,39 @@
+"""Make the notifications unread index partial
+
+Revision ID: 20260828_0016
+Revises: 20260828_0015
+Create Date: 2026-08-28
+
+The bell-badge poll counts unread rows per player; indexing only unread
+rows keeps that index tiny and the count an index-only scan.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260828_0016'
+down_revision: Union[str, None] = '20260828_0015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_notifications_player_unread', table_name='notifications')
+    op.create_index(
+        'ix_notifications_player_unread',
+        'notifications',
+        ['player_id'],
+        sqlite_where=sa.text('is_read = 0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_player_unread', table_name='notifications')
+    op.create_index(
+        'ix_notifications_player_unread',
+        'notifications',
+        ['player_id', 'is_read'],
+    )
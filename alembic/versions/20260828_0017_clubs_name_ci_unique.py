@@ -0,0 +1,34 @@
+"""Add case-insensitive unique index on club names
+
+Revision ID: 20260828_0017
+Revises: 20260828_0016
+Create Date: 2026-08-28
+
+The create/update club endpoints used to pre-check the name with an ilike
+SELECT, which was both an extra round-trip and racy under concurrent
+requests. A unique index on lower(name) lets the database enforce it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260828_0017'
+down_revision: Union[str, None] = '20260828_0016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ux_clubs_name_lower',
+        'clubs',
+        [sa.text('lower(name)')],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ux_clubs_name_lower', table_name='clubs')
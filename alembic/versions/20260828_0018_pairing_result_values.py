@@ -0,0 +1,71 @@
+"""Migrate pairing results from enum names to values and add CHECKs
+
+Revision ID: 20260828_0018
+Revises: 20260828_0017
+Create Date: 2026-08-28
+
+When pairings.result/claimed_result moved from SQLEnum(GameResult) to
+plain String(20), the stored representation changed with it: the Enum
+column persisted member NAMES ("PENDING", "WHITE_WINS"), while the
+StrEnum-backed string column writes and compares VALUES ("pending",
+"white_wins"). Existing rows were never rewritten, so on a pre-existing
+database every result comparison in the app silently missed. Every
+GameResult value is exactly the lowercase of its name, so lower() maps
+old rows to the new representation in place.
+
+The CHECK constraints restore the value-set enforcement the Enum column
+used to provide at the database level.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260828_0018'
+down_revision: Union[str, None] = '20260828_0017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_GAME_RESULT_SQL_LIST = (
+    "'pending', 'white_wins', 'black_wins', 'draw', "
+    "'white_forfeit', 'black_forfeit', 'double_forfeit', 'bye'"
+)
+
+
+def upgrade() -> None:
+    # Rewrite legacy enum-name rows before adding the CHECKs, which the
+    # old representation would violate
+    op.execute(
+        "UPDATE pairings SET result = lower(result) "
+        "WHERE result != lower(result)"
+    )
+    op.execute(
+        "UPDATE pairings SET claimed_result = lower(claimed_result) "
+        "WHERE claimed_result IS NOT NULL AND claimed_result != lower(claimed_result)"
+    )
+
+    with op.batch_alter_table('pairings') as batch_op:
+        batch_op.create_check_constraint(
+            'ck_pairings_result',
+            f"result IN ({_GAME_RESULT_SQL_LIST})",
+        )
+        batch_op.create_check_constraint(
+            'ck_pairings_claimed_result',
+            f"claimed_result IS NULL OR claimed_result IN ({_GAME_RESULT_SQL_LIST})",
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('pairings') as batch_op:
+        batch_op.drop_constraint('ck_pairings_claimed_result', type_='check')
+        batch_op.drop_constraint('ck_pairings_result', type_='check')
+
+    # Names are the uppercase of the values, so the rewrite inverts cleanly
+    op.execute("UPDATE pairings SET result = upper(result)")
+    op.execute(
+        "UPDATE pairings SET claimed_result = upper(claimed_result) "
+        "WHERE claimed_result IS NOT NULL"
+    )
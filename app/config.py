@@ -1,8 +1,12 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+import logging
 import secrets
 import os
 
+logger = logging.getLogger(__name__)
+
 
 class Settings(BaseSettings):
     # App
@@ -24,7 +28,10 @@ class Settings(BaseSettings):
     )
 
     # JWT Auth - IMPORTANT: Set SECRET_KEY env var in production!
-    secret_key: str = secrets.token_urlsafe(32)
+    # default_factory defers the CSPRNG call until the field is actually
+    # needed; a generated key is per-process, so tokens won't validate
+    # across workers or restarts without the env var
+    secret_key: str = Field(default_factory=lambda: secrets.token_urlsafe(32))
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 60 * 24 * 7  # 7 days
 
@@ -62,4 +69,11 @@ class Settings(BaseSettings):
 
 @lru_cache()
 def get_settings() -> Settings:
-    return Settings()
+    settings = Settings()
+    if settings.is_production() and not os.environ.get("SECRET_KEY"):
+        logger.warning(
+            "SECRET_KEY env var not set in production - using a generated "
+            "per-process key; sessions will not survive restarts or be "
+            "shared across workers"
+        )
+    return settings
@@ -1,50 +1,102 @@
+import os
+from datetime import datetime, timedelta
+from typing import Final
+
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy import event, text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import OperationalError
 
 from app.config import get_settings
 
 settings = get_settings()
 
-# SQLite production optimizations
-SQLITE_PRAGMAS = [
-    ("journal_mode", "WAL"),          # Write-Ahead Logging - concurrent reads during writes
+# SQLite production optimizations.
+# aiosqlite has no DSN-parameter form for pragmas (unlike some drivers), and
+# with aiosqlite every cursor.execute is a round-trip to its executor thread,
+# so keep the connect hook as cheap as possible: pragmas that persist in the
+# database file are applied once by the writer, everything else per connection.
+
+# Persist in the file header - writer applies them, readers inherit for free
+SQLITE_DB_PRAGMAS: Final = (
+    ("page_size", "4096"),             # Optimal page size (set before WAL)
+    ("journal_mode", "WAL"),           # Write-Ahead Logging - concurrent reads during writes
+)
+
+# Per-connection settings - must be applied on every new pool connection
+SQLITE_PRAGMAS: Final = (
     ("synchronous", "NORMAL"),         # Balance of safety and speed (FULL for max safety)
     ("cache_size", "-64000"),          # 64MB cache (negative = KB)
     ("busy_timeout", "30000"),         # Wait 30s on lock (handles burst traffic)
     ("foreign_keys", "ON"),            # Enforce referential integrity
     ("temp_store", "MEMORY"),          # Store temp tables in memory
     ("mmap_size", "268435456"),        # 256MB memory-mapped I/O
-    ("page_size", "4096"),             # Optimal page size
     ("wal_autocheckpoint", "1000"),    # Checkpoint every 1000 pages (~4MB)
-]
+)
+
+
+# Statements pre-rendered once at import; aiosqlite's DBAPI adapter exposes no
+# executescript, so the connect hook executes these frozen strings one by one
+# without any per-connection string formatting
+_PRAGMA_STMTS: Final = tuple(f"PRAGMA {k}={v};" for k, v in SQLITE_PRAGMAS)
+_PRAGMA_STMTS_WITH_DB: Final = tuple(f"PRAGMA {k}={v};" for k, v in SQLITE_DB_PRAGMAS) + _PRAGMA_STMTS
 
 
-def set_sqlite_pragmas(dbapi_conn, connection_record):
+def set_sqlite_pragmas(dbapi_conn, connection_record, include_db_pragmas=False):
     """Set SQLite pragmas for production performance"""
     cursor = dbapi_conn.cursor()
-    for pragma, value in SQLITE_PRAGMAS:
-        cursor.execute(f"PRAGMA {pragma}={value};")
+    for stmt in _PRAGMA_STMTS_WITH_DB if include_db_pragmas else _PRAGMA_STMTS:
+        cursor.execute(stmt)
     cursor.close()
 
 
-# Create engine with optimizations
-# Note: Pool settings don't apply to SQLite in-memory databases
-_is_sqlite_memory = ":memory:" in settings.database_url or "mode=memory" in settings.database_url
+# SQLite allows exactly one writer at a time, so funnel all writes through a
+# single-connection pool (writers queue in the pool instead of spinning on
+# SQLITE_BUSY) and give readers their own pool of read-only connections that
+# run in parallel against WAL snapshots.
+_IS_SQLITE = settings.database_url.startswith("sqlite")
+_IS_SQLITE_MEMORY = ":memory:" in settings.database_url or "mode=memory" in settings.database_url
 
-if _is_sqlite_memory:
-    # In-memory SQLite (testing) - use StaticPool
+if _IS_SQLITE_MEMORY:
+    # In-memory SQLite (testing) - use StaticPool; a single shared connection
+    # means there is no read/write split to make
     from sqlalchemy.pool import StaticPool
-    engine = create_async_engine(
+    write_engine = create_async_engine(
         settings.database_url,
         echo=settings.debug,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+    read_engine = write_engine
+elif _IS_SQLITE:
+    # File-based SQLite - one writer connection, many read-only readers.
+    # No pool_pre_ping: local file handles don't die like network
+    # connections, so the extra SELECT 1 per checkout buys nothing;
+    # lock waits are handled by busy_timeout and stale handles are
+    # rotated by pool_recycle.
+    _base_url = make_url(settings.database_url)
+    _read_url = _base_url.set(
+        database=f"file:{_base_url.database}",
+    ).update_query_dict({"mode": "ro", "uri": "true"})
+
+    write_engine = create_async_engine(
+        _base_url,
+        echo=settings.debug,
+        pool_size=1,               # SQLite has a single writer anyway
+        max_overflow=0,            # Extra writers would only stack up on the WAL lock
+        pool_recycle=1800,         # Recycle connections every 30 min
+    )
+    read_engine = create_async_engine(
+        _read_url,
+        echo=settings.debug,
+        pool_size=max(4, (os.cpu_count() or 1) * 2),
+        max_overflow=0,
+        pool_recycle=1800,
+    )
 else:
-    # Production/file-based database - use connection pooling
-    engine = create_async_engine(
+    # Non-SQLite database - single pooled engine for both roles
+    write_engine = create_async_engine(
         settings.database_url,
         echo=settings.debug,
         pool_size=20,              # Base connections
@@ -53,16 +105,51 @@ else:
         pool_recycle=1800,         # Recycle connections every 30 min
         pool_pre_ping=True,        # Verify connections before use
     )
+    read_engine = write_engine
+
+# Backwards-compatible alias (init_db, background services, tests)
+engine = write_engine
+
+# Maintenance statements (PRAGMA optimize / wal_checkpoint / ANALYZE) must
+# run outside any transaction - wal_checkpoint is illegal inside one, and
+# the write engine's begin hook wraps every session statement in BEGIN
+# IMMEDIATE. This AUTOCOMMIT view shares the write pool but never begins,
+# so the hook stays out of the way.
+maintenance_engine = write_engine.execution_options(isolation_level="AUTOCOMMIT")
 
 # Apply SQLite pragmas on every connection (skip for in-memory test databases)
-if "sqlite" in settings.database_url and not _is_sqlite_memory:
-    @event.listens_for(engine.sync_engine, "connect")
-    def on_connect(dbapi_conn, connection_record):
+if _IS_SQLITE and not _IS_SQLITE_MEMORY:
+    @event.listens_for(write_engine.sync_engine, "connect")
+    def on_connect_write(dbapi_conn, connection_record):
+        # Take over transaction control so we can emit BEGIN IMMEDIATE below
+        dbapi_conn.isolation_level = None
+        set_sqlite_pragmas(dbapi_conn, connection_record, include_db_pragmas=True)
+
+    @event.listens_for(write_engine.sync_engine, "begin")
+    def on_begin_write(conn):
+        # The maintenance engine shares this sync engine and must stay
+        # transaction-free (wal_checkpoint is illegal inside one); the
+        # logical begin event still fires under AUTOCOMMIT, so skip it
+        if conn.get_execution_options().get("isolation_level") == "AUTOCOMMIT":
+            return
+        # Acquire the write lock up front instead of upgrading a deferred
+        # read transaction mid-flight, which loses to concurrent writers
+        # with SQLITE_BUSY; waiting here is bounded by busy_timeout.
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    @event.listens_for(read_engine.sync_engine, "connect")
+    def on_connect_read(dbapi_conn, connection_record):
         set_sqlite_pragmas(dbapi_conn, connection_record)
 
 
 async_session_maker = async_sessionmaker(
-    engine,
+    write_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+read_session_maker = async_sessionmaker(
+    read_engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
@@ -73,6 +160,7 @@ class Base(DeclarativeBase):
 
 
 async def get_db() -> AsyncSession:
+    """Read-write session (default dependency)."""
     async with async_session_maker() as session:
         try:
             yield session
@@ -80,57 +168,147 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+async def get_db_read() -> AsyncSession:
+    """Read-only session for GET endpoints - runs on the parallel reader pool."""
+    async with read_session_maker() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+# Explicit name for write-path dependencies; same session factory as get_db
+get_db_write = get_db
+
+
+def updated_at_trigger_sql(table_name: str) -> str:
+    """DDL for the trigger that stamps updated_at on any UPDATE.
+
+    Covers raw-SQL and bulk UPDATE paths that never go through the ORM's
+    onupdate hooks; the WHEN guard lets an explicit updated_at write win.
+    """
+    return (
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table_name}_updated_at "
+        f"AFTER UPDATE ON {table_name} FOR EACH ROW "
+        f"WHEN NEW.updated_at = OLD.updated_at "
+        f"BEGIN UPDATE {table_name} SET updated_at = CURRENT_TIMESTAMP "
+        f"WHERE rowid = NEW.rowid; END"
+    )
+
+
 async def init_db():
     """Initialize database and create tables"""
-    async with engine.begin() as conn:
+    async with write_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    # updated_at maintenance triggers for every table that has the column
+    if _IS_SQLITE:
+        async with write_engine.begin() as conn:
+            for table in Base.metadata.tables.values():
+                if "updated_at" in table.c:
+                    await conn.exec_driver_sql(updated_at_trigger_sql(table.name))
+
     # Verify WAL mode is active
-    if "sqlite" in settings.database_url:
+    if _IS_SQLITE:
         async with async_session_maker() as session:
-            result = await session.execute(text("PRAGMA journal_mode;"))
+            result = await session.execute(_SQL_JOURNAL_MODE)
             mode = result.scalar()
             print(f"SQLite journal mode: {mode}")
 
 
 async def optimize_db():
     """Run periodic optimization (call this in a background task)"""
-    if "sqlite" not in settings.database_url:
+    if not _IS_SQLITE:
         return
 
-    async with async_session_maker() as session:
+    async with maintenance_engine.connect() as conn:
+        # Incremental stats refresh - unlike full ANALYZE this only touches
+        # tables that changed significantly, so it doesn't hold the write lock
+        await conn.execute(_SQL_OPTIMIZE)
+        # Optimize WAL file
+        await conn.execute(_SQL_WAL_CHECKPOINT_TRUNCATE)
+
+
+async def analyze_db():
+    """Full ANALYZE + WAL checkpoint - heavier; for the admin endpoint only"""
+    if not _IS_SQLITE:
+        return
+
+    async with maintenance_engine.connect() as conn:
         # Analyze tables for query optimizer
-        await session.execute(text("ANALYZE;"))
+        await conn.execute(_SQL_ANALYZE)
         # Optimize WAL file
-        await session.execute(text("PRAGMA wal_checkpoint(TRUNCATE);"))
+        await conn.execute(_SQL_WAL_CHECKPOINT_TRUNCATE)
+
+
+# Precompiled TextClause objects - text() re-parses its SQL on every call,
+# so hoist the recurring maintenance/monitoring statements to module scope
+_SQL_JOURNAL_MODE = text("PRAGMA journal_mode;")
+_SQL_OPTIMIZE = text("PRAGMA optimize;")
+_SQL_ANALYZE = text("ANALYZE;")
+_SQL_WAL_CHECKPOINT_TRUNCATE = text("PRAGMA wal_checkpoint(TRUNCATE);")
+_SQL_WAL_CHECKPOINT = text("PRAGMA wal_checkpoint;")
+_SQL_DB_SIZE = text("SELECT page_count * page_size FROM pragma_page_count(), pragma_page_size();")
+
+# Tables reported by get_db_stats; database size and all table counts come
+# back from one UNION ALL statement so /stats is two round-trips total
+_STATS_TABLES = ["players", "tournaments", "tournament_players", "pairings", "login_history", "security_flags", "device_fingerprints"]
+_STATS_SQL = text(
+    "SELECT 'db_size_bytes' AS tbl, page_count * page_size AS n FROM pragma_page_count(), pragma_page_size() UNION ALL "
+    + " UNION ALL ".join(f"SELECT '{t}' AS tbl, COUNT(*) AS n FROM {t}" for t in _STATS_TABLES)
+)
+
+
+# login_history grows with every login and SQLite has no table
+# partitioning to bound it, so old rows are swept instead. Security
+# investigations look at recent windows (24h/7d); half a year is far
+# more history than any of them use.
+LOGIN_HISTORY_RETENTION_DAYS = 180
+_SQL_PURGE_LOGIN_HISTORY = text(
+    "DELETE FROM login_history WHERE created_at < :cutoff"
+)
+
+
+async def purge_login_history(retention_days: int = LOGIN_HISTORY_RETENTION_DAYS):
+    """Delete login records older than the retention window.
+
+    Keeps the table and ix_login_history_player_created bounded. The
+    DELETE scans the table (created_at has no standalone index - on
+    purpose, see the model), so it's meant for the daily maintenance
+    pass, not the 15-minute optimize loop.
+    """
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    async with async_session_maker() as session:
+        await session.execute(_SQL_PURGE_LOGIN_HISTORY, {"cutoff": cutoff})
         await session.commit()
 
 
 async def get_db_stats():
     """Get database statistics for monitoring"""
-    if "sqlite" not in settings.database_url:
+    if not _IS_SQLITE:
         return {}
 
-    async with async_session_maker() as session:
+    # The checkpoint probe cannot run inside a transaction, so this goes
+    # through the maintenance engine; the counts stay mutually consistent
+    # regardless because _STATS_SQL is a single statement
+    async with maintenance_engine.connect() as conn:
         stats = {}
+        try:
+            # WAL size
+            result = await conn.execute(_SQL_WAL_CHECKPOINT)
+            row = result.fetchone()
+            if row:
+                stats["wal_frames"] = row[1] if len(row) > 1 else 0
 
-        # Database size
-        result = await session.execute(text("SELECT page_count * page_size FROM pragma_page_count(), pragma_page_size();"))
-        stats["db_size_bytes"] = result.scalar()
-
-        # WAL size
-        result = await session.execute(text("PRAGMA wal_checkpoint;"))
-        row = result.fetchone()
-        if row:
-            stats["wal_frames"] = row[1] if len(row) > 1 else 0
-
-        # Table counts
-        tables = ["players", "tournaments", "tournament_players", "pairings", "login_history", "security_flags", "device_fingerprints"]
-        for table in tables:
-            try:
-                result = await session.execute(text(f"SELECT COUNT(*) FROM {table};"))
-                stats[f"{table}_count"] = result.scalar()
-            except:
-                stats[f"{table}_count"] = 0
+            # Database size + table counts in a single statement
+            result = await conn.execute(_STATS_SQL)
+            for name, count in result.all():
+                stats[f"{name}_count" if name != "db_size_bytes" else name] = count
+        except OperationalError:
+            # Schema not created yet (fresh database); anything else
+            # propagates instead of masquerading as an empty database
+            stats.setdefault("db_size_bytes", 0)
+            for table in _STATS_TABLES:
+                stats.setdefault(f"{table}_count", 0)
 
         return stats
@@ -1,9 +1,14 @@
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
-from app.database import init_db, get_db_stats, optimize_db
+from app.database import (
+    init_db, get_db_stats, optimize_db, analyze_db, purge_login_history,
+    async_session_maker,
+)
 from app.routers import (
     auth_router, players_router, tournaments_router,
     pairings_router, utils_router, websocket_router
@@ -13,22 +18,61 @@ from app.routers.analytics import router as analytics_router, record_request
 from app.routers.security import router as security_router
 from app.routers.clubs import router as clubs_router
 from app.routers.notifications import router as notifications_router
+from app.middleware import LoginPrefilterMiddleware
 from app.services.background_sync import start_background_sync, stop_background_sync
+from app.services.security import security_service
 from app.services.tournament_automation import start_tournament_automation, stop_tournament_automation
 
 settings = get_settings()
 
+logger = logging.getLogger(__name__)
+
+
+# Periodic optimization interval in seconds (15 minutes, per SQLite docs)
+OPTIMIZE_INTERVAL = 15 * 60
+# Daily sweep of expired login_history rows
+PURGE_INTERVAL = 24 * 60 * 60
+
+
+async def _optimize_loop():
+    """Run PRAGMA optimize + WAL checkpoint periodically."""
+    purges_due = PURGE_INTERVAL // OPTIMIZE_INTERVAL
+    ticks = 0
+    while True:
+        await asyncio.sleep(OPTIMIZE_INTERVAL)
+        # A transient failure (e.g. "database is locked" under write
+        # pressure) must not kill the task for good - and each step fails
+        # on its own, so a bad optimize can't starve the retention sweep
+        try:
+            await optimize_db()
+        except Exception as e:
+            logger.error(f"Periodic optimize failed: {e}")
+        ticks += 1
+        if ticks >= purges_due:
+            ticks = 0
+            try:
+                await purge_login_history()
+            except Exception as e:
+                logger.error(f"Login-history purge failed: {e}")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: Create database tables
     await init_db()
+    # Prime the known-username filter so login can turn away sprayed
+    # unknown usernames without a query per attempt
+    async with async_session_maker() as session:
+        await security_service.load_known_usernames(session)
     # Start background Chess.com sync (every 30 minutes)
     start_background_sync()
     # Start tournament automation (every 5 minutes)
     start_tournament_automation()
+    # Periodic lightweight database optimization (every 15 minutes)
+    optimize_task = asyncio.create_task(_optimize_loop())
     yield
     # Shutdown: Stop background tasks
+    optimize_task.cancel()
     stop_background_sync()
     stop_tournament_automation()
 
@@ -51,6 +95,10 @@ CORS_ORIGINS = (
     ]
 )
 
+# Turn away malformed/oversized login bodies at the ASGI layer, before
+# FastAPI builds a Request, a DB session and runs validation (bot traffic)
+app.add_middleware(LoginPrefilterMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=CORS_ORIGINS,
@@ -109,8 +157,8 @@ async def db_stats():
 @app.post("/admin/optimize")
 async def run_optimization():
     """
-    Run database optimization (ANALYZE + WAL checkpoint).
-    Call this periodically (e.g., daily via cron).
+    Run full database optimization (ANALYZE + WAL checkpoint).
+    Heavier than the periodic PRAGMA optimize; call e.g. daily via cron.
     """
-    await optimize_db()
+    await analyze_db()
     return {"status": "optimized"}
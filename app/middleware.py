@@ -0,0 +1,94 @@
+"""
+Pure-ASGI pre-filter for the public login endpoints.
+
+Credential-stuffing traffic hits /login/json and /login/secure with
+garbage bodies; each such request still costs FastAPI a Request object,
+the dependency graph (including a database session) and a Pydantic
+validation pass before it's rejected. This middleware peeks at the raw
+ASGI messages first and turns away oversized or obviously malformed
+bodies with a direct 400/413, so only plausibly valid logins reach the
+framework. Valid requests are replayed to the app untouched.
+"""
+import orjson
+
+# JSON login endpoints guarded by the pre-filter (the form-based /login
+# is OAuth2 form-encoded and left alone)
+_LOGIN_PATHS = frozenset({
+    "/api/auth/login/json",
+    "/api/auth/login/secure",
+})
+
+# A credential payload is tiny; anything bigger is not a login attempt
+_MAX_BODY_BYTES = 2048
+
+_REQUIRED_KEYS = ("chess_com_username", "password")
+
+
+class LoginPrefilterMiddleware:
+    """Reject malformed login POSTs before FastAPI builds a request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"] not in _LOGIN_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        # Drain the request body (bounded - bail as soon as it's too big)
+        chunks = []
+        total = 0
+        more = True
+        while more:
+            message = await receive()
+            if message["type"] != "http.request":
+                # Client disconnected mid-body
+                await self._reject(send, 400, b'{"detail":"Invalid request body"}')
+                return
+            chunk = message.get("body", b"")
+            total += len(chunk)
+            if total > _MAX_BODY_BYTES:
+                await self._reject(send, 413, b'{"detail":"Request body too large"}')
+                return
+            chunks.append(chunk)
+            more = message.get("more_body", False)
+
+        body = b"".join(chunks)
+        try:
+            payload = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            await self._reject(send, 400, b'{"detail":"Invalid JSON body"}')
+            return
+        if not isinstance(payload, dict) or any(
+            not isinstance(payload.get(key), str) for key in _REQUIRED_KEYS
+        ):
+            await self._reject(send, 400, b'{"detail":"Missing credentials"}')
+            return
+
+        # Plausible login - replay the buffered body to the app
+        replayed = False
+
+        async def replay():
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(scope, replay, send)
+
+    @staticmethod
+    async def _reject(send, status: int, body: bytes):
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
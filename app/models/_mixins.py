@@ -0,0 +1,26 @@
+"""
+Shared model mixins.
+"""
+from datetime import datetime
+from sqlalchemy import DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class TimestampMixin:
+    """created_at / updated_at pair used across models.
+
+    server_default=func.now() lets Core-level batch INSERTs omit the columns
+    (SQLite fills CURRENT_TIMESTAMP in C); the Python defaults are kept so
+    freshly added objects have readable timestamps before a refresh.
+
+    updated_at is maintained by a per-table AFTER UPDATE trigger (created in
+    init_db and migration 0006) rather than a Python-side onupdate, so bulk
+    and raw-SQL UPDATE paths get stamped the same way ORM updates do.
+    """
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, server_default=func.now()
+    )
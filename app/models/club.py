@@ -1,18 +1,25 @@
-from sqlalchemy import Column, String, Integer, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, Integer, Text, DateTime, Boolean, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
 
 from app.database import Base
+from app.models._mixins import TimestampMixin
 
 if TYPE_CHECKING:
     from app.models.player import Player
 
 
-class Club(Base):
+class Club(TimestampMixin, Base):
     """Chess club model"""
     __tablename__ = "clubs"
 
+    __table_args__ = (
+        # Case-insensitive name uniqueness enforced by the database, so the
+        # create/update endpoints don't need a racy ilike pre-check
+        Index("ux_clubs_name_lower", text("lower(name)"), unique=True),
+    )
+
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     name: Mapped[str] = mapped_column(String(100), unique=True, index=True)
     logo_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Club logo image URL
@@ -37,12 +44,6 @@ class Club(Base):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False)
 
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
-    )
-
     # Relationships
     members: Mapped[List["Player"]] = relationship(
         "Player", back_populates="club_ref", foreign_keys="Player.club_id"
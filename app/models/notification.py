@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Boolean, DateTime, Text, Index
+from sqlalchemy import String, Boolean, DateTime, Text, Index, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -10,12 +10,26 @@ class Notification(Base):
     __tablename__ = "notifications"
 
     __table_args__ = (
-        Index("ix_notifications_player_unread", "player_id", "is_read"),
-        Index("ix_notifications_player_created", "player_id", "created_at"),
+        # Partial index for the bell-badge unread count - only unread rows
+        # are indexed, so the hottest poll in the app is a scan of a tiny
+        # index instead of a (player_id, is_read) range
+        Index(
+            "ix_notifications_player_unread",
+            "player_id",
+            sqlite_where=text("is_read = 0"),
+        ),
+        # id tiebreak so keyset pagination can seek to an exact (created_at,
+        # id) position within a player's notifications
+        Index(
+            "ix_notifications_player_created",
+            "player_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
     )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=lambda: uuid.uuid4().hex
     )
     player_id: Mapped[str] = mapped_column(String(36), index=True)
     type: Mapped[str] = mapped_column(String(50))  # pairing, result, no_show, claim, confirm, dispute
@@ -23,4 +37,4 @@ class Notification(Base):
     body: Mapped[str] = mapped_column(Text)
     data: Mapped[str] = mapped_column(Text, default="{}")  # JSON: tournament_id, pairing_id, opponent_phone, etc.
     is_read: Mapped[bool] = mapped_column(Boolean, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, server_default=func.now())
@@ -5,7 +5,7 @@ import uuid
 import secrets
 import hashlib
 from datetime import datetime, timedelta
-from sqlalchemy import String, DateTime, Integer, Boolean, Index
+from sqlalchemy import String, DateTime, Integer, Boolean, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -26,7 +26,7 @@ class OTP(Base):
     )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=lambda: uuid.uuid4().hex
     )
 
     phone: Mapped[str] = mapped_column(String(20), index=True)
@@ -40,24 +40,20 @@ class OTP(Base):
     is_used: Mapped[bool] = mapped_column(Boolean, default=False)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, server_default=func.now())
     expires_at: Mapped[datetime] = mapped_column(DateTime)
     used_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
 
     @staticmethod
     def generate_otp() -> str:
-        """Generate a random 6-digit OTP"""
-        return ''.join([str(secrets.randbelow(10)) for _ in range(OTP_LENGTH)])
+        """Generate a random 6-digit OTP with a single CSPRNG draw"""
+        return f"{secrets.randbelow(10 ** OTP_LENGTH):0{OTP_LENGTH}d}"
 
     @staticmethod
     def hash_otp(otp: str) -> str:
         """Hash OTP for secure storage"""
         return hashlib.sha256(otp.encode()).hexdigest()
 
-    def verify_otp(self, otp: str) -> bool:
-        """Verify if provided OTP matches"""
-        return self.otp_hash == self.hash_otp(otp)
-
     @property
     def is_expired(self) -> bool:
         return datetime.utcnow() > self.expires_at
@@ -1,17 +1,22 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Integer, DateTime, ForeignKey, Boolean, Text, Enum as SQLEnum, Index
+from sqlalchemy import (
+    String, Integer, DateTime, ForeignKey, Boolean, Text, Index,
+    CheckConstraint, text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, TYPE_CHECKING
 import enum
 
 from app.database import Base
+from app.models._mixins import TimestampMixin
 
 if TYPE_CHECKING:
+    from app.models.player import Player
     from app.models.tournament import Tournament
 
 
-class GameResult(str, enum.Enum):
+class GameResult(enum.StrEnum):
     PENDING = "pending"           # Not played yet
     WHITE_WINS = "white_wins"     # 1-0
     BLACK_WINS = "black_wins"     # 0-1
@@ -22,28 +27,56 @@ class GameResult(str, enum.Enum):
     BYE = "bye"                   # Odd number of players, one gets a bye
 
 
-class Pairing(Base):
+# Rendered once for the CHECK constraints below; str(member) is the value
+# for a StrEnum, so a new result only needs adding to the enum
+_GAME_RESULT_SQL_LIST = ", ".join(f"'{r}'" for r in GameResult)
+
+
+class Pairing(TimestampMixin, Base):
     __tablename__ = "pairings"
 
     # Indexes for pairing queries
     __table_args__ = (
-        Index("ix_pairings_tournament_round", "tournament_id", "round_number"),
+        # (tournament_id, round_number) lookups use the leftmost prefix of
+        # the wider tournament/round/board index below
         Index("ix_pairings_tournament_round_board", "tournament_id", "round_number", "board_number"),
         Index("ix_pairings_white_player", "white_player_id"),
         Index("ix_pairings_black_player", "black_player_id"),
         Index("ix_pairings_result", "tournament_id", "result"),  # Find pending games
         Index("ix_pairings_deadline", "deadline", "result"),  # For deadline processing
-        Index("ix_pairings_claimed", "tournament_id", "claimed_result", "is_disputed"),  # Pending confirmations
+        # Pending confirmations - partial index over only the rows with an
+        # undisputed open claim, a tiny slice of the table
+        Index(
+            "ix_pairings_claimed", "tournament_id", "claimed_at",
+            sqlite_where=text("claimed_result IS NOT NULL AND is_disputed = 0"),
+        ),
+        # Partial expression index matching the tournament-activity query's
+        # exact predicate: WHERE played_at IS NOT NULL GROUP BY date(played_at)
+        Index(
+            "ix_pairings_played_date", text("date(played_at)"),
+            sqlite_where=text("played_at IS NOT NULL"),
+        ),
+        # result/claimed_result are plain strings (see the result column
+        # comment); these CHECKs keep the value set as tight as the old
+        # SQLEnum column did
+        CheckConstraint(
+            f"result IN ({_GAME_RESULT_SQL_LIST})",
+            name="ck_pairings_result",
+        ),
+        CheckConstraint(
+            f"claimed_result IS NULL OR claimed_result IN ({_GAME_RESULT_SQL_LIST})",
+            name="ck_pairings_claimed_result",
+        ),
     )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=lambda: uuid.uuid4().hex
     )
 
     tournament_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("tournaments.id"), index=True
     )
-    round_number: Mapped[int] = mapped_column(Integer, index=True)
+    round_number: Mapped[int] = mapped_column(Integer)
 
     # Players (white_player or black_player can be null for BYE)
     white_player_id: Mapped[Optional[str]] = mapped_column(
@@ -56,18 +89,18 @@ class Pairing(Base):
     # Board number (for display: "Board 1", "Board 2", etc.)
     board_number: Mapped[int] = mapped_column(Integer, default=1)
 
-    # Result
-    result: Mapped[GameResult] = mapped_column(
-        SQLEnum(GameResult), default=GameResult.PENDING
-    )
+    # Result - stored as a plain string; GameResult is a StrEnum so
+    # comparisons like `pairing.result == GameResult.PENDING` still hold and
+    # ORM hydration skips the per-row enum coercion SQLEnum would do
+    result: Mapped[str] = mapped_column(String(20), default=GameResult.PENDING)
 
     # Chess.com game verification
     chess_com_game_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     chess_com_game_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
     # Notification tracking
-    white_notified: Mapped[bool] = mapped_column(Boolean, default=False)
-    black_notified: Mapped[bool] = mapped_column(Boolean, default=False)
+    white_notified: Mapped[bool] = mapped_column(Boolean, default=False, server_default=text("0"))
+    black_notified: Mapped[bool] = mapped_column(Boolean, default=False, server_default=text("0"))
 
     # Scheduling & Deadlines
     scheduled_time: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -81,8 +114,8 @@ class Pairing(Base):
     no_show_claimed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Result claim tracking (for in-person tournaments)
-    claimed_result: Mapped[Optional[GameResult]] = mapped_column(
-        SQLEnum(GameResult), nullable=True
+    claimed_result: Mapped[Optional[str]] = mapped_column(
+        String(20), nullable=True
     )  # The result being claimed (before confirmation)
     claimed_by: Mapped[Optional[str]] = mapped_column(
         String(36), ForeignKey("players.id"), nullable=True
@@ -95,18 +128,23 @@ class Pairing(Base):
         String(36), ForeignKey("players.id"), nullable=True
     )  # Opponent who confirmed the result
     confirmed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    is_disputed: Mapped[bool] = mapped_column(default=False)
+    is_disputed: Mapped[bool] = mapped_column(Boolean, default=False, server_default=text("0"))
     dispute_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
-    )
-
     # Relationships
     tournament: Mapped["Tournament"] = relationship(back_populates="pairings")
 
+    # Both sides of the board; several other columns also point at players,
+    # so the join condition must be pinned down explicitly. lazy="raise"
+    # because an accidental per-pairing lazy load is exactly the N+1 these
+    # exist to remove - callers opt in with selectinload.
+    white_player: Mapped[Optional["Player"]] = relationship(
+        "Player", foreign_keys=[white_player_id], lazy="raise"
+    )
+    black_player: Mapped[Optional["Player"]] = relationship(
+        "Player", foreign_keys=[black_player_id], lazy="raise"
+    )
+
     def __repr__(self) -> str:
         return f"<Pairing R{self.round_number}: {self.white_player_id} vs {self.black_player_id}>"
 
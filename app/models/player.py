@@ -1,10 +1,11 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Boolean, Integer, DateTime, Text, Index, ForeignKey
+from sqlalchemy import String, Boolean, Integer, DateTime, Text, Index, ForeignKey, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, List, TYPE_CHECKING
 
 from app.database import Base
+from app.models._mixins import TimestampMixin
 
 if TYPE_CHECKING:
     from app.models.tournament import TournamentPlayer
@@ -12,7 +13,7 @@ if TYPE_CHECKING:
     from app.models.club import Club
 
 
-class Player(Base):
+class Player(TimestampMixin, Base):
     __tablename__ = "players"
 
     # Indexes for fast lookups at scale
@@ -21,11 +22,15 @@ class Player(Base):
         Index("ix_players_gender", "gender"),
         Index("ix_players_age", "age"),
         Index("ix_players_created_at", "created_at"),
+        # Expression index matching the GROUP BY date(created_at) in the
+        # analytics time-series queries - wrapping the column in date() makes
+        # the plain created_at index unusable for that grouping
+        Index("ix_players_created_date", text("date(created_at)")),
         Index("ix_players_county_gender", "county", "gender"),  # Composite for filtered queries
     )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=lambda: uuid.uuid4().hex
     )
 
     # Chess.com integration
@@ -40,6 +45,7 @@ class Player(Base):
     rating_blitz: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     rating_bullet: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     ratings_updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    avatar_checked_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Local auth
     password_hash: Mapped[str] = mapped_column(String(128))
@@ -64,12 +70,6 @@ class Player(Base):
     push_subscription: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON subscription object
     push_enabled: Mapped[bool] = mapped_column(Boolean, default=True)
 
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
-    )
-
     # Security tracking
     is_flagged: Mapped[bool] = mapped_column(Boolean, default=False)  # Has open security flags
     security_risk_level: Mapped[str] = mapped_column(String(20), default="normal")  # normal, elevated, high, restricted
@@ -1,15 +1,22 @@
 import uuid
+import enum
 import hashlib
 from datetime import datetime
-from sqlalchemy import String, Boolean, Integer, DateTime, Text, Index, Float, ForeignKey
+from sqlalchemy import String, Boolean, Integer, DateTime, Text, Index, Float, ForeignKey, JSON, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, TYPE_CHECKING
 
 from app.database import Base
+from app.models._mixins import TimestampMixin
 
 if TYPE_CHECKING:
     from app.models.player import Player
 
+# Fingerprint hashing runs on every login; bind the hash constructor and the
+# stable component keys once so the hot path is just encode + one hash call
+_SHA256 = hashlib.sha256
+_FINGERPRINT_KEYS = ("platform", "screen_resolution", "timezone", "canvas_hash", "webgl_renderer")
+
 
 class LoginHistory(Base):
     """Track every login attempt with device and location info"""
@@ -20,15 +27,19 @@ class LoginHistory(Base):
     )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=lambda: uuid.uuid4().hex
     )
-    player_id: Mapped[str] = mapped_column(String(36), ForeignKey("players.id", ondelete="CASCADE"), index=True)
+    # player_id lookups ride the leftmost prefix of ix_login_history_player_created
+    player_id: Mapped[str] = mapped_column(String(36), ForeignKey("players.id", ondelete="CASCADE"))
 
     # Device fingerprint (hashed for comparison)
     fingerprint_hash: Mapped[str] = mapped_column(String(64), index=True)
 
     # Raw fingerprint components (for analysis)
-    user_agent: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # user_agent is write-only in the app (parsed before insert, excluded
+    # from the admin responses), so don't drag the full UA string along
+    # with every login-history row the security queries load
+    user_agent: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True)
     platform: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # Windows, macOS, Android, iOS
     browser: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     screen_resolution: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)  # e.g., "1920x1080"
@@ -49,7 +60,7 @@ class LoginHistory(Base):
     is_new_location: Mapped[bool] = mapped_column(Boolean, default=False)
     risk_score: Mapped[float] = mapped_column(Float, default=0.0)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, server_default=func.now())
 
     # Relationships
     player: Mapped["Player"] = relationship(back_populates="login_history")
@@ -57,16 +68,12 @@ class LoginHistory(Base):
     @staticmethod
     def generate_fingerprint_hash(components: dict) -> str:
         """Generate a consistent hash from fingerprint components"""
-        # Use stable components for hashing
-        stable_parts = [
-            components.get("platform", ""),
-            components.get("screen_resolution", ""),
-            components.get("timezone", ""),
-            components.get("canvas_hash", ""),
-            components.get("webgl_renderer", ""),
-        ]
-        fingerprint_string = "|".join(str(p) for p in stable_parts)
-        return hashlib.sha256(fingerprint_string.encode()).hexdigest()
+        # Encode each stable part directly and join as bytes - UTF-8 encoding
+        # distributes over concatenation, so the digest is identical to the
+        # old join-then-encode form for existing stored hashes
+        return _SHA256(
+            b"|".join(str(components.get(k, "")).encode() for k in _FINGERPRINT_KEYS)
+        ).hexdigest()
 
 
 class DeviceFingerprint(Base):
@@ -74,13 +81,14 @@ class DeviceFingerprint(Base):
     __tablename__ = "device_fingerprints"
 
     __table_args__ = (
-        Index("ix_device_fingerprints_player_id", "player_id"),
+        # Shared-device detection looks up by hash alone; player_id-only
+        # lookups use the leftmost prefix of the unique composite below
         Index("ix_device_fingerprints_hash", "fingerprint_hash"),
         Index("ix_device_fingerprints_player_hash", "player_id", "fingerprint_hash", unique=True),
     )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=lambda: uuid.uuid4().hex
     )
     player_id: Mapped[str] = mapped_column(String(36), ForeignKey("players.id", ondelete="CASCADE"))
 
@@ -98,33 +106,49 @@ class DeviceFingerprint(Base):
 
     # Usage stats
     login_count: Mapped[int] = mapped_column(Integer, default=1)
-    last_seen_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    first_seen_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    last_seen_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, server_default=func.now())
+    first_seen_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, server_default=func.now())
 
     # Relationships
     player: Mapped["Player"] = relationship(back_populates="devices")
 
 
+class FlagSeverity(enum.StrEnum):
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+    CRITICAL = "critical"
+
+
+class FlagStatus(enum.StrEnum):
+    OPEN = "open"
+    INVESTIGATING = "investigating"
+    RESOLVED = "resolved"
+    DISMISSED = "dismissed"
+
+
 class SecurityFlag(Base):
     """Track suspicious activities and security alerts"""
     __tablename__ = "security_flags"
 
     __table_args__ = (
         Index("ix_security_flags_player_id", "player_id"),
-        Index("ix_security_flags_severity", "severity"),
-        Index("ix_security_flags_status", "status"),
+        # (status, severity) serves both the open-flags count (leftmost
+        # prefix) and the dashboard's status + severity filter; the old
+        # standalone severity/status indexes only duplicated it
+        Index("ix_security_flags_status_severity", "status", "severity"),
         Index("ix_security_flags_created_at", "created_at"),
         Index("ix_security_flags_flag_type", "flag_type"),
     )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=lambda: uuid.uuid4().hex
     )
     player_id: Mapped[str] = mapped_column(String(36), ForeignKey("players.id", ondelete="CASCADE"))
 
     # Flag details
     flag_type: Mapped[str] = mapped_column(String(50))  # new_device, location_change, rapid_device_switch, shared_device, performance_anomaly
-    severity: Mapped[str] = mapped_column(String(20), default="low")  # low, medium, high, critical
+    severity: Mapped[str] = mapped_column(String(20), default=FlagSeverity.LOW)
 
     # Context
     title: Mapped[str] = mapped_column(String(200))
@@ -136,18 +160,18 @@ class SecurityFlag(Base):
     related_tournament_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
 
     # Status
-    status: Mapped[str] = mapped_column(String(20), default="open")  # open, investigating, resolved, dismissed
+    status: Mapped[str] = mapped_column(String(20), default=FlagStatus.OPEN)
     resolved_by: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)  # Admin player_id
     resolved_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     resolution_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, server_default=func.now())
 
     # Relationships
     player: Mapped["Player"] = relationship(back_populates="security_flags")
 
 
-class SharedDeviceAlert(Base):
+class SharedDeviceAlert(TimestampMixin, Base):
     """Track when same device is used by multiple accounts"""
     __tablename__ = "shared_device_alerts"
 
@@ -157,13 +181,13 @@ class SharedDeviceAlert(Base):
     )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=lambda: uuid.uuid4().hex
     )
 
     fingerprint_hash: Mapped[str] = mapped_column(String(64))
 
-    # Players involved (store as comma-separated IDs for simplicity)
-    player_ids: Mapped[str] = mapped_column(Text)  # JSON array of player IDs
+    # Players involved - JSON list of player ids, parsed once at hydration
+    player_ids: Mapped[list] = mapped_column(JSON)
     player_count: Mapped[int] = mapped_column(Integer, default=2)
 
     # Alert status
@@ -172,5 +196,3 @@ class SharedDeviceAlert(Base):
     reviewed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,12 +1,12 @@
 import uuid
-import json
 from datetime import datetime
-from sqlalchemy import String, Integer, DateTime, Text, ForeignKey, Float, Enum as SQLEnum, JSON, Index
+from sqlalchemy import String, Integer, DateTime, Text, ForeignKey, Float, Enum as SQLEnum, JSON, Index, text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, List, TYPE_CHECKING
 import enum
 
 from app.database import Base
+from app.models._mixins import TimestampMixin
 
 if TYPE_CHECKING:
     from app.models.player import Player
@@ -33,7 +33,7 @@ class GenderRestriction(str, enum.Enum):
     FEMALE_ONLY = "female_only"
 
 
-class Tournament(Base):
+class Tournament(TimestampMixin, Base):
     __tablename__ = "tournaments"
 
     # Indexes for fast lookups
@@ -44,7 +44,7 @@ class Tournament(Base):
     )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=lambda: uuid.uuid4().hex
     )
 
     # Basic info
@@ -76,9 +76,9 @@ class Tournament(Base):
     end_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Restrictions
-    county_restrictions: Mapped[Optional[str]] = mapped_column(
-        Text, nullable=True
-    )  # JSON list of allowed counties/regions, null = open to all
+    county_restrictions: Mapped[Optional[List[str]]] = mapped_column(
+        JSON, nullable=True
+    )  # List of allowed counties/regions, null = open to all
     min_rating: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     max_rating: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     min_age: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
@@ -86,9 +86,9 @@ class Tournament(Base):
     gender_restriction: Mapped[GenderRestriction] = mapped_column(
         SQLEnum(GenderRestriction), default=GenderRestriction.OPEN
     )
-    allowed_clubs: Mapped[Optional[str]] = mapped_column(
-        Text, nullable=True
-    )  # JSON list of allowed clubs, null = open to all
+    allowed_clubs: Mapped[Optional[List[str]]] = mapped_column(
+        JSON, nullable=True
+    )  # List of allowed clubs, null = open to all
 
     # Tournament type (online vs in-person)
     is_online: Mapped[bool] = mapped_column(default=True)  # False = in-person/OTB
@@ -105,35 +105,6 @@ class Tournament(Base):
         String(36), ForeignKey("players.id"), nullable=True
     )
 
-    # Helper methods for JSON fields
-    def get_county_restrictions(self) -> Optional[List[str]]:
-        if self.county_restrictions:
-            return json.loads(self.county_restrictions)
-        return None
-
-    def set_county_restrictions(self, counties: Optional[List[str]]):
-        if counties:
-            self.county_restrictions = json.dumps(counties)
-        else:
-            self.county_restrictions = None
-
-    def get_allowed_clubs(self) -> Optional[List[str]]:
-        if self.allowed_clubs:
-            return json.loads(self.allowed_clubs)
-        return None
-
-    def set_allowed_clubs(self, clubs: Optional[List[str]]):
-        if clubs:
-            self.allowed_clubs = json.dumps(clubs)
-        else:
-            self.allowed_clubs = None
-
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
-    )
-
     # Relationships
     players: Mapped[List["TournamentPlayer"]] = relationship(
         back_populates="tournament", cascade="all, delete-orphan"
@@ -152,13 +123,25 @@ class TournamentPlayer(Base):
 
     # Indexes for standings queries (most critical for performance)
     __table_args__ = (
-        Index("ix_tp_tournament_score", "tournament_id", "score"),  # Standings query
+        # Standings: mirrors the exact ORDER BY (score, then tiebreaks,
+        # all descending) over active players only, so the standings query
+        # reads rows straight off the index in display order
+        Index(
+            "ix_tp_standings", "tournament_id",
+            text("score DESC"), text("buchholz DESC"), text("sonneborn_berger DESC"),
+            sqlite_where=text("is_withdrawn = 0"),
+        ),
+        # Frozen leaderboards of completed tournaments
+        Index(
+            "ix_tp_final_rank", "tournament_id", "final_rank",
+            sqlite_where=text("final_rank IS NOT NULL"),
+        ),
         Index("ix_tp_tournament_withdrawn", "tournament_id", "is_withdrawn"),
         Index("ix_tp_tournament_player", "tournament_id", "player_id", unique=True),  # Unique constraint
     )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=lambda: uuid.uuid4().hex
     )
 
     tournament_id: Mapped[str] = mapped_column(
@@ -193,7 +176,7 @@ class TournamentPlayer(Base):
     has_paid: Mapped[bool] = mapped_column(default=False)
 
     # Timestamps
-    joined_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    joined_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, server_default=func.now())
 
     # Relationships
     tournament: Mapped["Tournament"] = relationship(back_populates="players")
@@ -1,35 +1,122 @@
 """
 Admin Analytics Router - Real historical data for dashboard charts
 """
+import array
+import time
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, text
+from sqlalchemy import case, select, func, text
 from datetime import datetime, timedelta
 from typing import List
-from collections import defaultdict
 
-from app.database import get_db
+from app.database import get_db_read
 from app.models.player import Player
 from app.models.tournament import Tournament
 from app.models.pairing import Pairing
+from app.services.cache import ttl_cache
+
+# These endpoints return large list-of-dict payloads (one dict per day/hour);
+# orjson serializes those several times faster than the stdlib encoder
+router = APIRouter(
+    prefix="/api/admin/analytics",
+    tags=["Admin Analytics"],
+    default_response_class=ORJSONResponse,
+)
+
+# Statements compiled once at import - text() re-parses its SQL on every
+# call, so don't rebuild these per request (same pattern as app.database).
+# Both growth endpoints share one statement; only :start_date differs.
+_USER_GROWTH_SQL = text("""
+    WITH RECURSIVE days(d) AS (
+        SELECT date(:start_date)
+        UNION ALL
+        SELECT date(d, '+1 day') FROM days WHERE d < date('now')
+    )
+    SELECT
+        d,
+        COALESCE(c.n, 0) AS new_users,
+        (SELECT COUNT(*) FROM players WHERE created_at < :start_date)
+            + SUM(COALESCE(c.n, 0)) OVER (ORDER BY d) AS total_users
+    FROM days
+    LEFT JOIN (
+        SELECT date(created_at) AS dt, COUNT(*) AS n
+        FROM players
+        WHERE created_at >= :start_date
+        GROUP BY dt
+    ) AS c ON c.dt = d
+    ORDER BY d ASC
+""")
+
+_TOURNAMENT_ACTIVITY_SQL = text("""
+    WITH RECURSIVE days(d) AS (
+        SELECT date(:start_date)
+        UNION ALL
+        SELECT date(d, '+1 day') FROM days WHERE d < date('now')
+    )
+    SELECT
+        d,
+        COALESCE(t.n, 0) AS tournaments,
+        COALESCE(g.n, 0) AS games
+    FROM days
+    LEFT JOIN (
+        SELECT date(created_at) AS dt, COUNT(*) AS n
+        FROM tournaments
+        WHERE created_at >= :start_date
+        GROUP BY dt
+    ) AS t ON t.dt = d
+    LEFT JOIN (
+        SELECT date(played_at) AS dt, COUNT(*) AS n
+        FROM pairings
+        WHERE played_at IS NOT NULL AND played_at >= :start_date
+        GROUP BY dt
+    ) AS g ON g.dt = d
+    ORDER BY d ASC
+""")
+
+# In-memory traffic tracking as a fixed ring of hourly buckets (resets on
+# server restart). A week of hours is more than the 24h the dashboard shows;
+# stale buckets are lazily reset when their slot comes around again, so the
+# structure never grows. In production, you'd want to persist this to database
+_TRAFFIC_BUCKETS = 168  # one week of hours
+_traffic_counts = array.array("Q", [0] * _TRAFFIC_BUCKETS)
+_traffic_hours = array.array("Q", [0] * _TRAFFIC_BUCKETS)
+
+# Chart labels for each hour of the day: "12am", "1am", ..., "11pm".
+# strftime("%-I%p") was called per hour per request, and %-I is a glibc
+# extension anyway; a 24-entry tuple indexed by hour replaces both.
+_HOUR_LABELS = tuple(
+    f"{(h - 1) % 12 + 1}{'am' if h < 12 else 'pm'}" for h in range(24)
+)
+
 
-router = APIRouter(prefix="/api/admin/analytics", tags=["Admin Analytics"])
+def record_request():
+    """Record a request for the current hour.
 
-# In-memory traffic tracking (resets on server restart)
-# In production, you'd want to persist this to database
-traffic_data: dict[str, int] = defaultdict(int)
+    Runs in the middleware for every request, so it must stay O(1): an
+    integer division and two array cells - no dict hashing, no
+    datetime/strftime formatting, no lock (ops are atomic under the GIL),
+    no I/O.
+    """
+    hour = int(time.time()) // 3600
+    idx = hour % _TRAFFIC_BUCKETS
+    if _traffic_hours[idx] != hour:
+        # Slot belonged to an hour a week ago (or is unused) - reclaim it
+        _traffic_hours[idx] = hour
+        _traffic_counts[idx] = 0
+    _traffic_counts[idx] += 1
 
 
-def record_request():
-    """Record a request for the current hour"""
-    hour_key = datetime.utcnow().strftime("%Y-%m-%d-%H")
-    traffic_data[hour_key] += 1
+def _requests_in_hour(hour: int) -> int:
+    """Read one ring bucket, treating reclaimed/unused slots as zero."""
+    idx = hour % _TRAFFIC_BUCKETS
+    return _traffic_counts[idx] if _traffic_hours[idx] == hour else 0
 
 
 @router.get("/user-growth")
 async def get_user_growth(
     days: int = 30,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_read)
 ):
     """
     Get user registration counts grouped by day.
@@ -38,49 +125,20 @@ async def get_user_growth(
     # Calculate the start date
     start_date = datetime.utcnow() - timedelta(days=days)
 
-    # Query to get registration counts by day
-    # Using SQLite's date function
-    query = text("""
-        SELECT
-            date(created_at) as registration_date,
-            COUNT(*) as count
-        FROM players
-        WHERE created_at >= :start_date
-        GROUP BY date(created_at)
-        ORDER BY registration_date ASC
-    """)
-
-    result = await db.execute(query, {"start_date": start_date.isoformat()})
-    rows = result.fetchall()
-
-    # Create a dict of date -> count
-    counts_by_date = {row[0]: row[1] for row in rows}
-
-    # Fill in missing days with 0
-    data = []
-    current_date = start_date.date()
-    end_date = datetime.utcnow().date()
-    cumulative = 0
-
-    # Get total users before start_date for cumulative count
-    prior_count_query = text("""
-        SELECT COUNT(*) FROM players WHERE created_at < :start_date
-    """)
-    prior_result = await db.execute(prior_count_query, {"start_date": start_date.isoformat()})
-    cumulative = prior_result.scalar() or 0
-
-    while current_date <= end_date:
-        date_str = current_date.isoformat()
-        daily_count = counts_by_date.get(date_str, 0)
-        cumulative += daily_count
-
-        data.append({
-            "date": date_str,
-            "name": current_date.strftime("%b %d"),  # e.g., "Jan 15"
-            "new_users": daily_count,
-            "total_users": cumulative
-        })
-        current_date += timedelta(days=1)
+    # One statement: a recursive-CTE calendar LEFT JOINed to the per-day
+    # registration counts, with the cumulative total computed by a window
+    # function - no gap-filling or running-sum loop in Python
+    result = await db.execute(_USER_GROWTH_SQL, {"start_date": start_date.isoformat()})
+
+    data = [
+        {
+            "date": d,
+            "name": datetime.strptime(d, "%Y-%m-%d").strftime("%b %d"),  # e.g., "Jan 15"
+            "new_users": new_users,
+            "total_users": total_users,
+        }
+        for d, new_users, total_users in result.fetchall()
+    ]
 
     return {
         "period_days": days,
@@ -89,55 +147,31 @@ async def get_user_growth(
 
 
 @router.get("/user-growth-weekly")
+@ttl_cache(seconds=30)
 async def get_user_growth_weekly(
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_read)
 ):
     """
     Get user registration data for the last 7 days (for dashboard chart).
     """
     start_date = datetime.utcnow() - timedelta(days=6)  # Last 7 days including today
 
-    query = text("""
-        SELECT
-            date(created_at) as registration_date,
-            COUNT(*) as count
-        FROM players
-        WHERE created_at >= :start_date
-        GROUP BY date(created_at)
-        ORDER BY registration_date ASC
-    """)
-
-    result = await db.execute(query, {"start_date": start_date.isoformat()})
-    rows = result.fetchall()
-
-    counts_by_date = {row[0]: row[1] for row in rows}
+    # Same calendar-CTE + window-function statement as /user-growth
+    result = await db.execute(_USER_GROWTH_SQL, {"start_date": start_date.isoformat()})
 
-    # Get cumulative count before the period
-    prior_query = text("SELECT COUNT(*) FROM players WHERE created_at < :start_date")
-    prior_result = await db.execute(prior_query, {"start_date": start_date.isoformat()})
-    cumulative = prior_result.scalar() or 0
-
-    data = []
-    current_date = start_date.date()
-    end_date = datetime.utcnow().date()
-
-    while current_date <= end_date:
-        date_str = current_date.isoformat()
-        daily_count = counts_by_date.get(date_str, 0)
-        cumulative += daily_count
-
-        data.append({
-            "name": current_date.strftime("%a"),  # e.g., "Mon"
-            "date": date_str,
-            "users": cumulative,
-            "new": daily_count
-        })
-        current_date += timedelta(days=1)
-
-    return data
+    return [
+        {
+            "name": datetime.strptime(d, "%Y-%m-%d").strftime("%a"),  # e.g., "Mon"
+            "date": d,
+            "users": total_users,
+            "new": new_users,
+        }
+        for d, new_users, total_users in result.fetchall()
+    ]
 
 
 @router.get("/traffic")
+@ttl_cache(seconds=30, key_params=("hours",))
 async def get_traffic_data(hours: int = 24):
     """
     Get API traffic data for the last N hours.
@@ -145,15 +179,15 @@ async def get_traffic_data(hours: int = 24):
     """
     data = []
     now = datetime.utcnow()
+    current_hour = int(time.time()) // 3600
 
     for i in range(hours - 1, -1, -1):
         hour = now - timedelta(hours=i)
-        hour_key = hour.strftime("%Y-%m-%d-%H")
-        requests = traffic_data.get(hour_key, 0)
+        requests = _requests_in_hour(current_hour - i)
 
         data.append({
-            "name": hour.strftime("%-I%p").lower() if hour.strftime("%p") else hour.strftime("%H:00"),
-            "hour": hour_key,
+            "name": _HOUR_LABELS[hour.hour],
+            "hour": hour.strftime("%Y-%m-%d-%H"),
             "requests": requests
         })
 
@@ -163,54 +197,25 @@ async def get_traffic_data(hours: int = 24):
 @router.get("/tournament-activity")
 async def get_tournament_activity(
     days: int = 30,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_read)
 ):
     """
     Get tournament creation and game activity over time.
     """
     start_date = datetime.utcnow() - timedelta(days=days)
 
-    # Tournaments created by day
-    tournaments_query = text("""
-        SELECT
-            date(created_at) as date,
-            COUNT(*) as count
-        FROM tournaments
-        WHERE created_at >= :start_date
-        GROUP BY date(created_at)
-        ORDER BY date ASC
-    """)
-
-    # Games played by day
-    games_query = text("""
-        SELECT
-            date(played_at) as date,
-            COUNT(*) as count
-        FROM pairings
-        WHERE played_at IS NOT NULL AND played_at >= :start_date
-        GROUP BY date(played_at)
-        ORDER BY date ASC
-    """)
-
-    tournaments_result = await db.execute(tournaments_query, {"start_date": start_date.isoformat()})
-    games_result = await db.execute(games_query, {"start_date": start_date.isoformat()})
+    # Both per-day series joined to one calendar CTE in a single statement
+    result = await db.execute(_TOURNAMENT_ACTIVITY_SQL, {"start_date": start_date.isoformat()})
 
-    tournaments_by_date = {row[0]: row[1] for row in tournaments_result.fetchall()}
-    games_by_date = {row[0]: row[1] for row in games_result.fetchall()}
-
-    data = []
-    current_date = start_date.date()
-    end_date = datetime.utcnow().date()
-
-    while current_date <= end_date:
-        date_str = current_date.isoformat()
-        data.append({
-            "date": date_str,
-            "name": current_date.strftime("%b %d"),
-            "tournaments": tournaments_by_date.get(date_str, 0),
-            "games": games_by_date.get(date_str, 0)
-        })
-        current_date += timedelta(days=1)
+    data = [
+        {
+            "date": d,
+            "name": datetime.strptime(d, "%Y-%m-%d").strftime("%b %d"),
+            "tournaments": tournaments,
+            "games": games,
+        }
+        for d, tournaments, games in result.fetchall()
+    ]
 
     return {
         "period_days": days,
@@ -219,8 +224,9 @@ async def get_tournament_activity(
 
 
 @router.get("/summary")
+@ttl_cache(seconds=30)
 async def get_analytics_summary(
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_read)
 ):
     """
     Get summary statistics for the admin dashboard.
@@ -228,33 +234,33 @@ async def get_analytics_summary(
     now = datetime.utcnow()
     today = now.date()
     week_ago = now - timedelta(days=7)
+    two_weeks_ago = week_ago - timedelta(days=7)
     month_ago = now - timedelta(days=30)
 
-    # Total users
-    total_users = await db.execute(select(func.count(Player.id)))
-    total_users = total_users.scalar() or 0
-
-    # New users this week
-    new_users_week = await db.execute(
-        select(func.count(Player.id)).where(Player.created_at >= week_ago)
+    # Conditional aggregation: one pass over each table instead of seven
+    # sequential COUNT queries whose latencies add up
+    players_row = await db.execute(
+        select(
+            func.count(Player.id),
+            func.sum(case((Player.created_at >= week_ago, 1), else_=0)),
+            func.sum(case((Player.created_at >= month_ago, 1), else_=0)),
+            func.sum(case(
+                ((Player.created_at >= two_weeks_ago) & (Player.created_at < week_ago), 1),
+                else_=0,
+            )),
+        )
     )
-    new_users_week = new_users_week.scalar() or 0
-
-    # New users this month
-    new_users_month = await db.execute(
-        select(func.count(Player.id)).where(Player.created_at >= month_ago)
+    total_users, new_users_week, new_users_month, users_week_before = (
+        value or 0 for value in players_row.one()
     )
-    new_users_month = new_users_month.scalar() or 0
 
-    # Active tournaments
-    active_tournaments = await db.execute(
-        select(func.count(Tournament.id)).where(Tournament.status == "active")
+    tournaments_row = await db.execute(
+        select(
+            func.count(Tournament.id),
+            func.sum(case((Tournament.status == "active", 1), else_=0)),
+        )
     )
-    active_tournaments = active_tournaments.scalar() or 0
-
-    # Total tournaments
-    total_tournaments = await db.execute(select(func.count(Tournament.id)))
-    total_tournaments = total_tournaments.scalar() or 0
+    total_tournaments, active_tournaments = (value or 0 for value in tournaments_row.one())
 
     # Games played this week
     games_week = await db.execute(
@@ -265,15 +271,6 @@ async def get_analytics_summary(
     )
     games_week = games_week.scalar() or 0
 
-    # Calculate growth rate
-    users_week_before = await db.execute(
-        select(func.count(Player.id)).where(
-            Player.created_at >= (week_ago - timedelta(days=7)),
-            Player.created_at < week_ago
-        )
-    )
-    users_week_before = users_week_before.scalar() or 0
-
     growth_rate = 0
     if users_week_before > 0:
         growth_rate = round(((new_users_week - users_week_before) / users_week_before) * 100, 1)
@@ -289,7 +286,8 @@ async def get_analytics_summary(
         "total_tournaments": total_tournaments,
         "games_this_week": games_week,
         "total_requests_today": sum(
-            count for key, count in traffic_data.items()
-            if key.startswith(today.isoformat())
+            _requests_in_hour(hour_key)
+            for hour_key in range(int(time.time()) // 3600 - now.hour,
+                                  int(time.time()) // 3600 + 1)
         )
     }
@@ -1,11 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+import asyncio
+import hashlib
+
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Request
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select, update, or_
 
 from datetime import datetime, timedelta
 
-from app.database import get_db
+from app.database import get_db, get_db_read, async_session_maker
 from app.models.player import Player
 from app.models.otp import OTP, OTP_COOLDOWN_MINUTES, MAX_OTP_ATTEMPTS
 from app.schemas.player import (
@@ -16,9 +21,46 @@ from app.schemas.security import DeviceFingerprintData, RiskAnalysisResponse
 from app.services.auth import AuthService, get_current_player
 from app.services.chess_com import chess_com_service
 from app.services.sms import sms_service
-from app.services.security import security_service
+from app.services.security import security_service, risk_level_for
+
+# orjson response encoding - Token/PlayerResponse is serialized on every
+# login, same reasoning as the analytics router
+router = APIRouter(
+    prefix="/api/auth",
+    tags=["Authentication"],
+    default_response_class=ORJSONResponse,
+)
+
+# Re-check a player's Chess.com avatar at most this often
+AVATAR_CHECK_INTERVAL = timedelta(hours=24)
 
-router = APIRouter(prefix="/api/auth", tags=["Authentication"])
+# The point lookups every auth endpoint starts with, built once at import
+# time (same pattern as the hoisted statements in app.database/analytics)
+_PLAYER_BY_USERNAME = select(Player).where(
+    Player.chess_com_username == bindparam("username")
+)
+_PLAYER_BY_PHONE = select(Player).where(Player.phone == bindparam("phone"))
+
+# Pre-rendered /push/vapid-key response, built on first request
+_VAPID_RESPONSE = None
+
+
+async def _refresh_avatar(player_id: str):
+    """Background avatar refresh - own short-lived session, off the login path."""
+    try:
+        profile = None
+        async with async_session_maker() as session:
+            player = await session.get(Player, player_id)
+            if not player:
+                return
+            profile = await chess_com_service.get_player_profile(player.chess_com_username)
+            player.avatar_checked_at = datetime.utcnow()
+            if profile and profile.avatar != player.chess_com_avatar:
+                player.chess_com_avatar = profile.avatar
+            await session.commit()
+    except Exception:
+        # Cosmetic refresh - never let a Chess.com hiccup surface anywhere
+        pass
 
 
 @router.post("/register", response_model=Token, status_code=status.HTTP_201_CREATED)
@@ -32,34 +74,38 @@ async def register(
     2. Fetches profile data (avatar, etc.)
     3. Creates local account with password
     """
-    # Check if username already registered locally
-    result = await db.execute(
-        select(Player).where(
-            Player.chess_com_username == player_data.chess_com_username.lower()
-        )
+    # Overlap the uniqueness check (one round-trip, both columns uniquely
+    # indexed) with the independent Chess.com profile fetch - the HTTP call
+    # dominates registration wall time, so don't serialize behind it
+    uname = player_data.chess_com_username.lower()
+    result, profile = await asyncio.gather(
+        db.execute(
+            select(Player.chess_com_username, Player.phone).where(
+                or_(
+                    Player.chess_com_username == uname,
+                    Player.phone == player_data.phone,
+                )
+            )
+        ),
+        chess_com_service.get_player_profile(player_data.chess_com_username),
     )
-    if result.scalar_one_or_none():
+    existing = result.all()
+    if any(existing_username == uname for existing_username, _ in existing):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="This Chess.com username is already registered"
         )
-
-    # Verify Chess.com username exists
-    profile = await chess_com_service.get_player_profile(player_data.chess_com_username)
-    if not profile:
+    if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Chess.com username not found. Please check the username and try again."
+            detail="This phone number is already registered"
         )
 
-    # Check if phone already registered
-    result = await db.execute(
-        select(Player).where(Player.phone == player_data.phone)
-    )
-    if result.scalar_one_or_none():
+    # Verify Chess.com username exists
+    if not profile:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="This phone number is already registered"
+            detail="Chess.com username not found. Please check the username and try again."
         )
 
     # Extract country code from Chess.com country URL (e.g., "https://api.chess.com/pub/country/KE" -> "KE")
@@ -82,7 +128,7 @@ async def register(
         chess_com_joined=profile.joined,
         chess_com_status=profile.status,
         chess_com_country=chess_com_country,
-        password_hash=AuthService.hash_password(player_data.password),
+        password_hash=await AuthService.hash_password_async(player_data.password),
         phone=player_data.phone,
         age=player_data.age,
         gender=player_data.gender,
@@ -92,19 +138,23 @@ async def register(
 
     db.add(player)
     await db.commit()
-    await db.refresh(player)
+    # No refresh: the session doesn't expire on commit and every column
+    # (id, timestamps) was populated Python-side at flush
+
+    security_service.note_registered(player.chess_com_username)
 
     # Create access token
     access_token = AuthService.create_access_token(data={"sub": player.id})
 
     return Token(
         access_token=access_token,
-        player=PlayerResponse.model_validate(player)
+        player=PlayerResponse.from_player(player)
     )
 
 
 @router.post("/login", response_model=Token)
 async def login(
+    background_tasks: BackgroundTasks,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: AsyncSession = Depends(get_db)
 ):
@@ -114,13 +164,14 @@ async def login(
     """
     # Find player by username
     result = await db.execute(
-        select(Player).where(
-            Player.chess_com_username == form_data.username.lower()
-        )
+        _PLAYER_BY_USERNAME, {"username": form_data.username.lower()}
     )
     player = result.scalar_one_or_none()
 
-    if not player or not AuthService.verify_password(form_data.password, player.password_hash):
+    password_ok = await AuthService.verify_password_async(
+        form_data.password, player.password_hash if player else None
+    )
+    if not player or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -133,19 +184,19 @@ async def login(
             detail="Account is deactivated"
         )
 
-    # Update avatar from Chess.com (in case it changed)
-    profile = await chess_com_service.get_player_profile(player.chess_com_username)
-    if profile and profile.avatar != player.chess_com_avatar:
-        player.chess_com_avatar = profile.avatar
-        await db.commit()
-        await db.refresh(player)
+    # Avatar refresh is cosmetic - don't spend an external HTTP round-trip
+    # on the auth critical path; at most once a day, check it in the
+    # background after the response has gone out
+    now = datetime.utcnow()
+    if not player.avatar_checked_at or now - player.avatar_checked_at > AVATAR_CHECK_INTERVAL:
+        background_tasks.add_task(_refresh_avatar, player.id)
 
     # Create access token
     access_token = AuthService.create_access_token(data={"sub": player.id})
 
     return Token(
         access_token=access_token,
-        player=PlayerResponse.model_validate(player)
+        player=PlayerResponse.from_player(player)
     )
 
 
@@ -185,14 +236,23 @@ async def login_json(
             detail="This account is temporarily locked due to too many failed attempts."
         )
 
-    result = await db.execute(
-        select(Player).where(
-            Player.chess_com_username == credentials.chess_com_username.lower()
+    # Credential-stuffing sprays mostly unknown usernames - answer those
+    # from the in-process filter (with a cheap existence probe backstop
+    # for players registered outside this process) instead of loading a
+    # full row per attempt. The dummy password check below still runs, so
+    # timing doesn't reveal whether the miss came from the filter or the
+    # table.
+    player = None
+    if await security_service.is_known_username(db, credentials.chess_com_username):
+        result = await db.execute(
+            _PLAYER_BY_USERNAME, {"username": credentials.chess_com_username.lower()}
         )
-    )
-    player = result.scalar_one_or_none()
+        player = result.scalar_one_or_none()
 
-    if not player or not AuthService.verify_password(credentials.password, player.password_hash):
+    password_ok = await AuthService.verify_password_async(
+        credentials.password, player.password_hash if player else None
+    )
+    if not player or not password_ok:
         # Record failed attempt
         await security_service.record_failed_login(
             db,
@@ -221,18 +281,18 @@ async def login_json(
 
     return Token(
         access_token=access_token,
-        player=PlayerResponse.model_validate(player)
+        player=PlayerResponse.from_player(player)
     )
 
 
 @router.get("/me", response_model=PlayerResponse)
 async def get_me(current_player: Player = Depends(get_current_player)):
     """Get current authenticated player's profile"""
-    return PlayerResponse.model_validate(current_player)
+    return PlayerResponse.from_player(current_player)
 
 
 @router.get("/verify/{username}")
-async def verify_chess_com_username(username: str):
+async def verify_chess_com_username(username: str, request: Request):
     """
     Check if a Chess.com username exists.
     Useful for frontend validation before registration.
@@ -241,28 +301,40 @@ async def verify_chess_com_username(username: str):
     profile = await chess_com_service.get_player_profile(username)
 
     if not profile:
-        return {
+        payload = {
             "exists": False,
             "message": "Username not found on Chess.com"
         }
+    else:
+        # Extract country code from URL (e.g., "https://api.chess.com/pub/country/KE" -> "KE")
+        country_code = None
+        if profile.country:
+            country_code = profile.country.rstrip("/").split("/")[-1].upper()
+
+        payload = {
+            "exists": True,
+            "username": profile.username,
+            "avatar": profile.avatar,
+            "status": profile.status,
+            "country": country_code
+        }
 
-    # Extract country code from URL (e.g., "https://api.chess.com/pub/country/KE" -> "KE")
-    country_code = None
-    if profile.country:
-        country_code = profile.country.rstrip("/").split("/")[-1].upper()
-
-    return {
-        "exists": True,
-        "username": profile.username,
-        "avatar": profile.avatar,
-        "status": profile.status,
-        "country": country_code
+    # Frontends call this per keystroke; an ETag turns repeats into 304s
+    # and Cache-Control lets the browser skip the request entirely
+    body = orjson.dumps(payload)
+    headers = {
+        "ETag": f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"',
+        "Cache-Control": "public, max-age=300",
     }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.post("/request-reset")
 async def request_password_reset(
     request: PasswordResetRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -271,13 +343,19 @@ async def request_password_reset(
     The OTP will be sent via SMS (when integrated).
     For testing, the OTP is returned in the response.
     """
-    # Check if phone exists
+    # One round-trip for "does the phone exist" and "when was the last OTP":
+    # the cooldown check needs only the newest created_at, not a full row
+    last_otp_at = (
+        select(func.max(OTP.created_at))
+        .where(OTP.phone == request.phone, OTP.purpose == "password_reset")
+        .scalar_subquery()
+    )
     result = await db.execute(
-        select(Player).where(Player.phone == request.phone)
+        select(Player.id, last_otp_at).where(Player.phone == request.phone)
     )
-    player = result.scalar_one_or_none()
+    row = result.first()
 
-    if not player:
+    if row is None:
         # Don't reveal if phone exists or not (security)
         # But return same response format
         return {
@@ -285,51 +363,47 @@ async def request_password_reset(
             "expires_in_minutes": 10
         }
 
-    # Check for recent OTP requests (rate limiting)
-    cooldown_time = datetime.utcnow() - timedelta(minutes=OTP_COOLDOWN_MINUTES)
-    result = await db.execute(
-        select(OTP).where(
-            OTP.phone == request.phone,
-            OTP.purpose == "password_reset",
-            OTP.created_at > cooldown_time
-        ).order_by(OTP.created_at.desc())
-    )
-    recent_otp = result.scalar_one_or_none()
-
-    if recent_otp:
-        wait_seconds = int((recent_otp.created_at + timedelta(minutes=OTP_COOLDOWN_MINUTES) - datetime.utcnow()).total_seconds())
+    # Cooldown between OTP requests (rate limiting) - one clock read per
+    # request so the comparison and the reported wait agree
+    last_created = row[1]
+    now = datetime.utcnow()
+    if last_created is not None and last_created > now - timedelta(minutes=OTP_COOLDOWN_MINUTES):
+        wait_seconds = int((last_created + timedelta(minutes=OTP_COOLDOWN_MINUTES) - now).total_seconds())
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail=f"Please wait {wait_seconds} seconds before requesting another OTP"
         )
 
-    # Invalidate any existing unused OTPs
-    result = await db.execute(
-        select(OTP).where(
+    # Invalidate any existing unused OTPs in one UPDATE instead of
+    # selecting them and flushing a per-row change each
+    await db.execute(
+        update(OTP)
+        .where(
             OTP.phone == request.phone,
             OTP.purpose == "password_reset",
             OTP.is_used == False
         )
+        .values(is_used=True)
     )
-    old_otps = result.scalars().all()
-    for old_otp in old_otps:
-        old_otp.is_used = True
 
     # Create new OTP
     otp_instance, raw_otp = OTP.create_for_phone(request.phone, "password_reset")
     db.add(otp_instance)
     await db.commit()
 
-    # Send SMS via Africa's Talking
-    sms_result = await sms_service.send_otp(request.phone, raw_otp)
-
     response = {
         "message": "If this phone is registered, you will receive an OTP",
         "expires_in_minutes": 10
     }
 
-    # Include debug OTP only if SMS not configured (for development)
-    if not sms_service.is_configured():
+    if sms_service.is_configured():
+        # Send via Africa's Talking after the response - the gateway
+        # round-trip is the slowest thing on this path by far
+        background_tasks.add_task(sms_service.send_otp, request.phone, raw_otp)
+    else:
+        # SMS not configured (development): send synchronously so the debug
+        # print lands before the response, and return the OTP for testing
+        await sms_service.send_otp(request.phone, raw_otp)
         response["_debug_otp"] = raw_otp
         response["_debug_note"] = "SMS not configured. Set AT_USERNAME and AT_API_KEY in .env"
 
@@ -350,9 +424,7 @@ async def reset_password(
     - new_password: New password (min 6 characters)
     """
     # Find the player
-    result = await db.execute(
-        select(Player).where(Player.phone == request.phone)
-    )
+    result = await db.execute(_PLAYER_BY_PHONE, {"phone": request.phone})
     player = result.scalar_one_or_none()
 
     if not player:
@@ -361,56 +433,71 @@ async def reset_password(
             detail="Invalid phone number or OTP"
         )
 
-    # Find valid OTP
+    # Consume the OTP in one atomic UPDATE: the hash match, expiry and
+    # attempts cap are all conditions of the same statement, so concurrent
+    # requests can't race between a SELECT and a later flush to sneak past
+    # the attempts limit
+    now = datetime.utcnow()
     result = await db.execute(
-        select(OTP).where(
+        update(OTP)
+        .where(
             OTP.phone == request.phone,
             OTP.purpose == "password_reset",
             OTP.is_used == False,
-            OTP.expires_at > datetime.utcnow()
-        ).order_by(OTP.created_at.desc())
+            OTP.expires_at > now,
+            OTP.attempts < MAX_OTP_ATTEMPTS,
+            OTP.otp_hash == OTP.hash_otp(request.otp),
+        )
+        .values(is_used=True, used_at=now, attempts=OTP.attempts + 1)
+        .returning(OTP.id)
     )
-    otp_record = result.scalar_one_or_none()
 
-    if not otp_record:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid or expired OTP. Please request a new one."
+    if result.first() is not None:
+        # OTP is valid - update password in the same transaction
+        player.password_hash = await AuthService.hash_password_async(request.new_password)
+        await db.commit()
+        return {
+            "message": "Password reset successful. You can now login with your new password."
+        }
+
+    # Wrong code (or no live OTP): bump the counter atomically, retiring
+    # the OTP once the cap is reached
+    result = await db.execute(
+        update(OTP)
+        .where(
+            OTP.phone == request.phone,
+            OTP.purpose == "password_reset",
+            OTP.is_used == False,
+            OTP.expires_at > now,
+        )
+        .values(
+            attempts=OTP.attempts + 1,
+            is_used=OTP.attempts + 1 >= MAX_OTP_ATTEMPTS,
         )
+        .returning(OTP.attempts)
+    )
+    attempts = result.scalar()
+    await db.commit()
 
-    # Check attempts
-    if otp_record.attempts >= MAX_OTP_ATTEMPTS:
-        otp_record.is_used = True
-        await db.commit()
+    if attempts is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Too many failed attempts. Please request a new OTP."
+            detail="Invalid or expired OTP. Please request a new one."
         )
-
-    # Verify OTP
-    if not otp_record.verify_otp(request.otp):
-        otp_record.attempts += 1
-        await db.commit()
-        remaining = MAX_OTP_ATTEMPTS - otp_record.attempts
+    if attempts >= MAX_OTP_ATTEMPTS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid OTP. {remaining} attempts remaining."
+            detail="Too many failed attempts. Please request a new OTP."
         )
-
-    # OTP is valid - update password
-    player.password_hash = AuthService.hash_password(request.new_password)
-    otp_record.is_used = True
-    otp_record.used_at = datetime.utcnow()
-
-    await db.commit()
-
-    return {
-        "message": "Password reset successful. You can now login with your new password."
-    }
+    remaining = MAX_OTP_ATTEMPTS - attempts
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Invalid OTP. {remaining} attempts remaining."
+    )
 
 
 @router.get("/push/vapid-key")
-async def get_vapid_public_key():
+async def get_vapid_public_key(request: Request):
     """
     Get the VAPID public key for Web Push subscription.
 
@@ -425,16 +512,38 @@ async def get_vapid_public_key():
     // Then POST subscription to /api/auth/push/subscribe
     ```
     """
-    from app.services.push import push_service
-
-    public_key = push_service.get_public_key()
-    if not public_key:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Push notifications not configured"
+    global _VAPID_RESPONSE
+
+    # The key is fixed for the process lifetime - render the response once
+    # and let browsers/CDNs cache it for a day
+    if _VAPID_RESPONSE is None:
+        from app.services.push import push_service
+
+        public_key = push_service.get_public_key()
+        if not public_key:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Push notifications not configured"
+            )
+        _VAPID_RESPONSE = ORJSONResponse(
+            {"vapid_public_key": public_key},
+            headers={
+                "Cache-Control": "public, max-age=86400",
+                # The key itself is the version - clients only re-download
+                # if the VAPID keys ever rotate
+                "ETag": f'"{public_key[:16]}"',
+            },
         )
 
-    return {"vapid_public_key": public_key}
+    if request.headers.get("if-none-match") == _VAPID_RESPONSE.headers["etag"]:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={
+                "Cache-Control": "public, max-age=86400",
+                "ETag": _VAPID_RESPONSE.headers["etag"],
+            },
+        )
+    return _VAPID_RESPONSE
 
 
 @router.post("/push/subscribe")
@@ -456,8 +565,6 @@ async def subscribe_to_push(
                 }
             }
     """
-    import json
-
     # Validate subscription format
     if not subscription.get("endpoint") or not subscription.get("keys"):
         raise HTTPException(
@@ -465,7 +572,7 @@ async def subscribe_to_push(
             detail="Invalid subscription format. Need endpoint and keys."
         )
 
-    current_player.push_subscription = json.dumps(subscription)
+    current_player.push_subscription = orjson.dumps(subscription).decode()
     current_player.push_enabled = True
     await db.commit()
 
@@ -507,16 +614,22 @@ async def toggle_push_notifications(
 # ============ Security / Fingerprint Tracking ============
 
 def get_client_ip(request: Request) -> str:
-    """Extract client IP address from request"""
-    # Check for forwarded headers (when behind proxy/load balancer)
-    forwarded_for = request.headers.get("X-Forwarded-For")
-    if forwarded_for:
-        # Take the first IP in the list (original client)
-        return forwarded_for.split(",")[0].strip()
+    """
+    Extract client IP address from request.
 
-    real_ip = request.headers.get("X-Real-IP")
-    if real_ip:
-        return real_ip
+    Scans the raw ASGI header list (lowercase byte names) instead of going
+    through request.headers, which would decode the whole header mapping
+    for the one or two values needed here on every login/fingerprint call.
+    """
+    real_ip = None
+    for name, value in request.scope["headers"]:
+        if name == b"x-forwarded-for":
+            # Take the first IP in the list (original client behind proxy)
+            return value.split(b",", 1)[0].strip().decode("latin-1")
+        if name == b"x-real-ip":
+            real_ip = value
+    if real_ip is not None:
+        return real_ip.decode("latin-1")
 
     # Fall back to direct connection IP
     return request.client.host if request.client else "unknown"
@@ -551,20 +664,11 @@ async def record_fingerprint(
         session_type="login",
     )
 
-    # Determine risk level for response
-    risk_level = "low"
-    if risk_score >= 80:
-        risk_level = "critical"
-    elif risk_score >= 60:
-        risk_level = "high"
-    elif risk_score >= 40:
-        risk_level = "medium"
-
     return {
         "message": "Fingerprint recorded",
         "is_new_device": login_record.is_new_device,
         "risk_score": risk_score,
-        "risk_level": risk_level,
+        "risk_level": risk_level_for(risk_score),
     }
 
 
@@ -597,10 +701,32 @@ async def record_registration_fingerprint(
     }
 
 
+async def _record_login_background(
+    player_id: str, fingerprint: DeviceFingerprintData, ip_address: str
+):
+    """Security tracking for /login/secure - own session, after the response."""
+    try:
+        async with async_session_maker() as session:
+            player = await session.get(Player, player_id)
+            if not player:
+                return
+            await security_service.record_login(
+                db=session,
+                player=player,
+                fingerprint_data=fingerprint,
+                ip_address=ip_address,
+                session_type="login",
+            )
+    except Exception:
+        # Tracking must never surface errors to (or slow down) anyone
+        pass
+
+
 @router.post("/login/secure", response_model=Token)
 async def login_with_fingerprint(
     credentials: PlayerLoginWithFingerprint,
     request: Request,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -611,13 +737,14 @@ async def login_with_fingerprint(
     """
     # Find player by username
     result = await db.execute(
-        select(Player).where(
-            Player.chess_com_username == credentials.chess_com_username.lower()
-        )
+        _PLAYER_BY_USERNAME, {"username": credentials.chess_com_username.lower()}
     )
     player = result.scalar_one_or_none()
 
-    if not player or not AuthService.verify_password(credentials.password, player.password_hash):
+    password_ok = await AuthService.verify_password_async(
+        credentials.password, player.password_hash if player else None
+    )
+    if not player or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password"
@@ -629,23 +756,16 @@ async def login_with_fingerprint(
             detail="Account is deactivated"
         )
 
-    # Track login if fingerprint provided
-    risk_score = 0.0
+    # Track login if fingerprint provided - risk scoring and device writes
+    # run after the response; the restriction check below reads the cached
+    # security_risk_level column, so it doesn't need this request's score
     if credentials.fingerprint:
-        try:
-            fingerprint_data = DeviceFingerprintData(**credentials.fingerprint)
-            ip_address = get_client_ip(request)
-
-            login_record, risk_score = await security_service.record_login(
-                db=db,
-                player=player,
-                fingerprint_data=fingerprint_data,
-                ip_address=ip_address,
-                session_type="login",
-            )
-        except Exception:
-            # Don't fail login if fingerprint tracking fails
-            pass
+        background_tasks.add_task(
+            _record_login_background,
+            player.id,
+            credentials.fingerprint,
+            get_client_ip(request),
+        )
 
     # Check if player is restricted due to security concerns
     if player.security_risk_level == "restricted":
@@ -659,13 +779,13 @@ async def login_with_fingerprint(
 
     return Token(
         access_token=access_token,
-        player=PlayerResponse.model_validate(player)
+        player=PlayerResponse.from_player(player)
     )
 
 
 @router.get("/security/status")
 async def get_security_status(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     current_player: Player = Depends(get_current_player)
 ):
     """
@@ -1,19 +1,22 @@
 """
 Clubs API router - CRUD operations for chess clubs
 """
+import asyncio
 import uuid
 from datetime import datetime
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field, field_validator
-from sqlalchemy import select, func
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+from sqlalchemy import select, update, func, cast, Integer
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, raiseload
 
-from app.database import get_db
+from app.database import get_db, get_db_read, read_session_maker
 from app.models.club import Club
 from app.models.player import Player
 from app.services.auth import get_current_player, get_current_admin
+from app.services.cache import ttl_cache
 
 
 # ============== Schemas ==============
@@ -40,6 +43,15 @@ class ClubUpdate(BaseModel):
     is_verified: Optional[bool] = None
 
 
+# Performance ordering shared by the default list sort and the rank window
+_PERFORMANCE_ORDER = (
+    Club.total_points.desc(),
+    Club.tournament_wins.desc(),
+    Club.average_rating.desc(),
+    Club.name,
+)
+
+
 class ClubResponse(BaseModel):
     id: str
     name: str
@@ -59,6 +71,8 @@ class ClubResponse(BaseModel):
     is_active: bool
     is_verified: bool
     created_at: datetime
+    # Rank within the returned set, filled for performance-sorted listings
+    rank: Optional[int] = None
 
     @field_validator("county", mode="before")
     @classmethod
@@ -82,12 +96,24 @@ class ClubListResponse(BaseModel):
     page_size: int
 
 
+# Validates a whole page in one C-level pass instead of a per-row
+# model_validate loop
+_CLUB_LIST_ADAPTER = TypeAdapter(List[ClubResponse])
+
+
 # ============== Router ==============
 
 router = APIRouter(prefix="/clubs", tags=["clubs"])
 
 
 @router.get("", response_model=ClubListResponse)
+@ttl_cache(
+    seconds=300,
+    key_params=(
+        "county", "club_type", "search", "is_active",
+        "sort_by", "page", "page_size",
+    ),
+)
 async def list_clubs(
     county: Optional[str] = None,
     club_type: Optional[str] = None,
@@ -96,10 +122,12 @@ async def list_clubs(
     sort_by: str = Query("performance", description="Sort by: performance, members, rating, name"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
 ):
     """List all clubs ranked by performance (default) with optional filtering"""
-    query = select(Club).where(Club.is_active == is_active)
+    # Listings never serialize members - raiseload turns any accidental
+    # lazy load into a hard error instead of a silent query storm
+    query = select(Club).where(Club.is_active == is_active).options(raiseload("*"))
 
     if county:
         query = query.where(Club.county == county)
@@ -110,33 +138,45 @@ async def list_clubs(
     if search:
         query = query.where(Club.name.ilike(f"%{search}%"))
 
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
+    # Total comes back with the rows as COUNT(*) OVER () instead of a
+    # second query re-running every filter (a page past the end reads as
+    # total 0, which no pager ever requests)
+    total_col = func.count().over().label("total")
 
     # Sort by performance metrics (best clubs first)
     if sort_by == "performance":
-        # Primary: total points, Secondary: tournament wins, Tertiary: average rating
-        query = query.order_by(
-            Club.total_points.desc(),
-            Club.tournament_wins.desc(),
-            Club.average_rating.desc(),
-            Club.name
+        # Each row carries its rank within the filtered set via a window
+        # function, so no follow-up query is needed per club
+        rank_col = func.rank().over(order_by=_PERFORMANCE_ORDER).label("rank")
+        query = query.add_columns(rank_col, total_col).order_by(*_PERFORMANCE_ORDER)
+        query = query.offset((page - 1) * page_size).limit(page_size)
+
+        rows = (await db.execute(query)).all()
+        total = rows[0].total if rows else 0
+        clubs = _CLUB_LIST_ADAPTER.validate_python(
+            [row.Club for row in rows], from_attributes=True
+        )
+        for item, row in zip(clubs, rows):
+            item.rank = row.rank
+    else:
+        if sort_by == "members":
+            query = query.order_by(Club.member_count.desc(), Club.name)
+        elif sort_by == "rating":
+            query = query.order_by(Club.average_rating.desc(), Club.name)
+        else:  # name
+            query = query.order_by(Club.name)
+
+        query = query.add_columns(total_col)
+        query = query.offset((page - 1) * page_size).limit(page_size)
+
+        rows = (await db.execute(query)).all()
+        total = rows[0].total if rows else 0
+        clubs = _CLUB_LIST_ADAPTER.validate_python(
+            [row.Club for row in rows], from_attributes=True
         )
-    elif sort_by == "members":
-        query = query.order_by(Club.member_count.desc(), Club.name)
-    elif sort_by == "rating":
-        query = query.order_by(Club.average_rating.desc(), Club.name)
-    else:  # name
-        query = query.order_by(Club.name)
-
-    query = query.offset((page - 1) * page_size).limit(page_size)
-
-    result = await db.execute(query)
-    clubs = result.scalars().all()
 
     return ClubListResponse(
-        clubs=[ClubResponse.model_validate(c) for c in clubs],
+        clubs=clubs,
         total=total,
         page=page,
         page_size=page_size,
@@ -144,7 +184,7 @@ async def list_clubs(
 
 
 @router.get("/counties")
-async def list_counties_with_clubs(db: AsyncSession = Depends(get_db)):
+async def list_counties_with_clubs(db: AsyncSession = Depends(get_db_read)):
     """Get list of counties that have clubs"""
     query = (
         select(Club.county, func.count(Club.id).label("club_count"))
@@ -158,27 +198,30 @@ async def list_counties_with_clubs(db: AsyncSession = Depends(get_db)):
     return [{"county": row[0], "club_count": row[1]} for row in rows]
 
 
-@router.get("/{club_id}", response_model=ClubDetailResponse)
-async def get_club(club_id: str, db: AsyncSession = Depends(get_db)):
-    """Get club details with members and ranking"""
-    query = select(Club).where(Club.id == club_id).options(selectinload(Club.members))
-    result = await db.execute(query)
-    club = result.scalar_one_or_none()
-
-    if not club:
-        raise HTTPException(status_code=404, detail="Club not found")
-
-    # Calculate club's rank (how many clubs have more points)
-    rank_query = select(func.count()).select_from(Club).where(
-        Club.is_active == True,
-        Club.total_points > club.total_points
-    )
-    rank_result = await db.execute(rank_query)
-    rank = (rank_result.scalar() or 0) + 1  # +1 because rank is 1-indexed
-
-    # Build members list sorted by rating
-    members = sorted(
-        [
+async def _fetch_club_members(club_id: str) -> List[dict]:
+    """Load the member list on its own session so it can run concurrently
+    with the club/rank query (one AsyncSession serializes its statements).
+
+    The request's own session is also a reader, but gather()ing both
+    queries needs a second reader-pool connection - hence a dedicated
+    session here instead of the injected one.
+    """
+    # Members arrive filtered, sorted and trimmed to the serialized columns
+    # straight from the index - no loading whole Player rows (inactive ones
+    # included) just to discard and re-sort them in Python
+    async with read_session_maker() as session:
+        result = await session.execute(
+            select(
+                Player.id,
+                Player.chess_com_username,
+                Player.rating_rapid,
+                Player.rating_blitz,
+                Player.chess_com_avatar,
+            )
+            .where(Player.club_id == club_id, Player.is_active == True)
+            .order_by(Player.rating_rapid.desc().nullslast())
+        )
+        return [
             {
                 "id": m.id,
                 "chess_com_username": m.chess_com_username,
@@ -186,16 +229,45 @@ async def get_club(club_id: str, db: AsyncSession = Depends(get_db)):
                 "rating_blitz": m.rating_blitz,
                 "avatar": m.chess_com_avatar,
             }
-            for m in club.members
-            if m.is_active
-        ],
-        key=lambda x: x["rating_rapid"] or 0,
-        reverse=True
+            for m in result
+        ]
+
+
+@router.get("/{club_id}", response_model=ClubDetailResponse)
+async def get_club(club_id: str, db: AsyncSession = Depends(get_db_read)):
+    """Get club details with members and ranking"""
+    # Rank every active club in a CTE and join the one we want - a single
+    # round-trip instead of a follow-up COUNT of better clubs
+    ranked = (
+        select(
+            Club.id.label("id"),
+            func.rank().over(order_by=_PERFORMANCE_ORDER).label("rank"),
+        )
+        .where(Club.is_active == True)
+        .cte("ranked_clubs")
+    )
+    query = (
+        select(Club, ranked.c.rank)
+        .outerjoin(ranked, Club.id == ranked.c.id)  # outer: inactive clubs rank as None
+        .where(Club.id == club_id)
+        .options(raiseload("*"))
+    )
+    # Independent reads, so overlap them: the club/rank query on the request
+    # session, the member list on its own session
+    result, members = await asyncio.gather(
+        db.execute(query), _fetch_club_members(club_id)
     )
+    row = result.first()
+
+    if not row:
+        raise HTTPException(status_code=404, detail="Club not found")
+
+    club, rank = row
 
     return ClubDetailResponse(
         id=club.id,
         name=club.name,
+        logo_url=club.logo_url,
         county=club.county,
         club_type=club.club_type,
         description=club.description,
@@ -221,13 +293,6 @@ async def create_club(
     admin: Player = Depends(get_current_admin),
 ):
     """Create a new club (admin only)"""
-    # Check if name already exists
-    existing = await db.execute(
-        select(Club).where(Club.name.ilike(club_data.name))
-    )
-    if existing.scalar_one_or_none():
-        raise HTTPException(status_code=400, detail="Club with this name already exists")
-
     club = Club(
         id=str(uuid.uuid4()),
         name=club_data.name,
@@ -245,7 +310,15 @@ async def create_club(
     )
 
     db.add(club)
-    await db.commit()
+    # Name uniqueness (case-insensitive) is enforced by ux_clubs_name_lower;
+    # letting the INSERT hit the index saves a SELECT per call and closes the
+    # race a pre-check would leave open
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Club with this name already exists")
+    list_clubs.cache_clear()  # club data changed - drop cached listings
     await db.refresh(club)
 
     return ClubResponse.model_validate(club)
@@ -259,26 +332,25 @@ async def update_club(
     admin: Player = Depends(get_current_admin),
 ):
     """Update a club (admin only)"""
-    result = await db.execute(select(Club).where(Club.id == club_id))
+    result = await db.execute(select(Club).where(Club.id == club_id).options(raiseload("*")))
     club = result.scalar_one_or_none()
 
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
 
-    # Check for duplicate name if changing
-    if club_data.name and club_data.name != club.name:
-        existing = await db.execute(
-            select(Club).where(Club.name.ilike(club_data.name))
-        )
-        if existing.scalar_one_or_none():
-            raise HTTPException(status_code=400, detail="Club with this name already exists")
-
     # Update fields
     update_data = club_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(club, field, value)
 
-    await db.commit()
+    # Duplicate names (case-insensitive) surface from ux_clubs_name_lower
+    # instead of a racy pre-check SELECT
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Club with this name already exists")
+    list_clubs.cache_clear()  # club data changed - drop cached listings
     await db.refresh(club)
 
     return ClubResponse.model_validate(club)
@@ -291,23 +363,22 @@ async def delete_club(
     admin: Player = Depends(get_current_admin),
 ):
     """Delete a club (admin only) - sets is_active=False and removes member associations"""
+    # Soft delete; rowcount doubles as the existence check
     result = await db.execute(
-        select(Club).where(Club.id == club_id).options(selectinload(Club.members))
+        update(Club).where(Club.id == club_id).values(is_active=False, member_count=0)
     )
-    club = result.scalar_one_or_none()
 
-    if not club:
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Club not found")
 
-    # Remove all member associations
-    for member in club.members:
-        member.club_id = None
-
-    # Soft delete
-    club.is_active = False
-    club.member_count = 0
+    # One bulk UPDATE disassociates every member - no loading the whole
+    # roster just to null a column row by row
+    await db.execute(
+        update(Player).where(Player.club_id == club_id).values(club_id=None, club=None)
+    )
 
     await db.commit()
+    list_clubs.cache_clear()  # club data changed - drop cached listings
 
 
 @router.post("/{club_id}/join")
@@ -317,7 +388,7 @@ async def join_club(
     player: Player = Depends(get_current_player),
 ):
     """Join a club (authenticated players)"""
-    result = await db.execute(select(Club).where(Club.id == club_id))
+    result = await db.execute(select(Club).where(Club.id == club_id).options(raiseload("*")))
     club = result.scalar_one_or_none()
 
     if not club:
@@ -343,6 +414,7 @@ async def join_club(
     club.member_count += 1
 
     await db.commit()
+    list_clubs.cache_clear()  # club data changed - drop cached listings
 
     return {"message": f"Successfully joined {club.name}"}
 
@@ -357,7 +429,7 @@ async def leave_club(
     if player.club_id != club_id:
         raise HTTPException(status_code=400, detail="Not a member of this club")
 
-    result = await db.execute(select(Club).where(Club.id == club_id))
+    result = await db.execute(select(Club).where(Club.id == club_id).options(raiseload("*")))
     club = result.scalar_one_or_none()
 
     if not club:
@@ -371,6 +443,7 @@ async def leave_club(
     club.member_count = max(0, club.member_count - 1)
 
     await db.commit()
+    list_clubs.cache_clear()  # club data changed - drop cached listings
 
     return {"message": f"Successfully left {club.name}"}
 
@@ -383,38 +456,52 @@ async def add_member_to_club(
     admin: Player = Depends(get_current_admin),
 ):
     """Add a player to a club (admin only)"""
-    result = await db.execute(select(Club).where(Club.id == club_id))
-    club = result.scalar_one_or_none()
+    # Everything needed to validate and answer in one round-trip: the new
+    # club's name plus the player's username and current club, each via a
+    # scalar subquery (no FROM, so the row always comes back)
+    checks = (
+        await db.execute(
+            select(
+                select(Club.name).where(Club.id == club_id).scalar_subquery().label("club_name"),
+                select(Player.chess_com_username)
+                .where(Player.id == player_id)
+                .scalar_subquery()
+                .label("username"),
+                select(Player.club_id).where(Player.id == player_id).scalar_subquery().label("old_club_id"),
+            )
+        )
+    ).one()
 
-    if not club:
+    if checks.club_name is None:
         raise HTTPException(status_code=404, detail="Club not found")
 
-    result = await db.execute(select(Player).where(Player.id == player_id))
-    player = result.scalar_one_or_none()
-
-    if not player:
+    if checks.username is None:
         raise HTTPException(status_code=404, detail="Player not found")
 
-    if player.club_id == club_id:
+    if checks.old_club_id == club_id:
         raise HTTPException(status_code=400, detail="Player is already a member")
 
-    # Remove from old club if any
-    if player.club_id:
-        old_club_result = await db.execute(
-            select(Club).where(Club.id == player.club_id)
+    # Set-based counter moves instead of loading club rows just to bump an
+    # integer; max() is SQLite's scalar GREATEST
+    if checks.old_club_id:
+        await db.execute(
+            update(Club)
+            .where(Club.id == checks.old_club_id)
+            .values(member_count=func.max(Club.member_count - 1, 0))
         )
-        old_club = old_club_result.scalar_one_or_none()
-        if old_club:
-            old_club.member_count = max(0, old_club.member_count - 1)
-
-    # Add to new club
-    player.club_id = club_id
-    player.club = club.name
-    club.member_count += 1
+    await db.execute(
+        update(Club).where(Club.id == club_id).values(member_count=Club.member_count + 1)
+    )
+    await db.execute(
+        update(Player)
+        .where(Player.id == player_id)
+        .values(club_id=club_id, club=checks.club_name)
+    )
 
     await db.commit()
+    list_clubs.cache_clear()  # club data changed - drop cached listings
 
-    return {"message": f"Added {player.chess_com_username} to {club.name}"}
+    return {"message": f"Added {checks.username} to {checks.club_name}"}
 
 
 @router.delete("/{club_id}/members/{player_id}", status_code=204)
@@ -425,7 +512,7 @@ async def remove_member_from_club(
     admin: Player = Depends(get_current_admin),
 ):
     """Remove a player from a club (admin only)"""
-    result = await db.execute(select(Club).where(Club.id == club_id))
+    result = await db.execute(select(Club).where(Club.id == club_id).options(raiseload("*")))
     club = result.scalar_one_or_none()
 
     if not club:
@@ -446,6 +533,7 @@ async def remove_member_from_club(
     club.member_count = max(0, club.member_count - 1)
 
     await db.commit()
+    list_clubs.cache_clear()  # club data changed - drop cached listings
 
 
 @router.post("/{club_id}/refresh-stats")
@@ -456,7 +544,7 @@ async def refresh_club_stats(
 ):
     """Recalculate all stats for a club (admin only)"""
     result = await db.execute(
-        select(Club).where(Club.id == club_id).options(selectinload(Club.members))
+        select(Club).where(Club.id == club_id).options(selectinload(Club.members), raiseload("*"))
     )
     club = result.scalar_one_or_none()
 
@@ -472,6 +560,7 @@ async def refresh_club_stats(
     club.average_rating = int(sum(ratings) / len(ratings)) if ratings else 0
 
     await db.commit()
+    list_clubs.cache_clear()  # club data changed - drop cached listings
 
     return {
         "member_count": club.member_count,
@@ -487,20 +576,28 @@ async def refresh_all_club_stats(
     admin: Player = Depends(get_current_admin),
 ):
     """Recalculate stats for all clubs (admin only)"""
+    # One UPDATE with correlated aggregates over players - no loading every
+    # club and its members into Python just to count and average them
+    member_count_sq = (
+        select(func.count())
+        .where(Player.club_id == Club.id, Player.is_active == True)
+        .scalar_subquery()
+    )
+    average_rating_sq = (
+        select(func.coalesce(cast(func.avg(Player.rating_rapid), Integer), 0))
+        .where(
+            Player.club_id == Club.id,
+            Player.is_active == True,
+            Player.rating_rapid.isnot(None),
+        )
+        .scalar_subquery()
+    )
     result = await db.execute(
-        select(Club).where(Club.is_active == True).options(selectinload(Club.members))
+        update(Club)
+        .where(Club.is_active == True)
+        .values(member_count=member_count_sq, average_rating=average_rating_sq)
     )
-    clubs = result.scalars().all()
-
-    updated = 0
-    for club in clubs:
-        active_members = [m for m in club.members if m.is_active]
-        club.member_count = len(active_members)
-
-        ratings = [m.rating_rapid for m in active_members if m.rating_rapid]
-        club.average_rating = int(sum(ratings) / len(ratings)) if ratings else 0
-        updated += 1
-
     await db.commit()
+    list_clubs.cache_clear()  # club data changed - drop cached listings
 
-    return {"updated_clubs": updated}
+    return {"updated_clubs": result.rowcount}
@@ -1,11 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
+import base64
+import hashlib
+
+import orjson
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, func, and_
+from sqlalchemy import select, update, func, and_, tuple_, bindparam
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
-from app.database import get_db
+from app.database import get_db, get_db_read
 from app.models.player import Player
 from app.models.notification import Notification
 from app.services.auth import get_current_player
@@ -28,38 +34,136 @@ class UnreadCountResponse(BaseModel):
     count: int
 
 
-@router.get("", response_model=List[NotificationResponse])
+def _encode_cursor(created_at: datetime, notification_id: str) -> str:
+    """Pack the last row's sort key (created_at, id) into an opaque cursor."""
+    raw = f"{created_at.isoformat()}|{notification_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    """Inverse of _encode_cursor; raises 400 on anything malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_raw, _, last_id = raw.rpartition("|")
+        return datetime.fromisoformat(created_raw), last_id
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+# Fixed-shape statements built once at import instead of per request (same
+# pattern as the hoisted login statements in app.routers.auth); only the
+# bound parameters change between calls
+_UNREAD_COUNT_STMT = select(func.count()).where(
+    Notification.player_id == bindparam("player_id"),
+    Notification.is_read.is_(False),
+)
+
+# Column names are reserved for the SET clause in update(), hence the b_
+# prefix on these parameter names
+_MARK_READ_STMT = (
+    update(Notification)
+    .where(
+        Notification.id == bindparam("b_notification_id"),
+        Notification.player_id == bindparam("b_player_id"),
+    )
+    .values(is_read=True)
+    .returning(Notification)
+    # Without this, RETURNING hands back a stale identity-mapped object if
+    # the row was already loaded in this session
+    .execution_options(populate_existing=True)
+)
+
+
+# The serialized notification columns, in response order - selecting these
+# instead of the entity skips ORM hydration for rows we only read once
+_NOTIFICATION_COLUMNS = (
+    Notification.id,
+    Notification.player_id,
+    Notification.type,
+    Notification.title,
+    Notification.body,
+    Notification.data,
+    Notification.is_read,
+    Notification.created_at,
+)
+
+
+@router.get("", response_model=None)
 async def list_notifications(
+    request: Request,
     skip: int = 0,
     limit: int = 30,
     unread_only: bool = False,
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db_read),
     current_player: Player = Depends(get_current_player),
 ):
-    """List notifications for current player with pagination."""
-    query = select(Notification).where(Notification.player_id == current_player.id)
+    """
+    List notifications for current player with pagination.
+
+    Prefer the `cursor` param (opaque, from the X-Next-Cursor response
+    header of the previous page): it seeks straight to the page via the
+    (player_id, created_at, id) index instead of scanning and discarding
+    `skip` rows. `skip` is kept as a deprecated fallback.
+
+    Returns plain dicts through orjson - the feed is read-once data, so
+    ORM hydration and a Pydantic validation pass buy nothing here.
+    """
+    query = select(*_NOTIFICATION_COLUMNS).where(
+        Notification.player_id == current_player.id
+    )
     if unread_only:
         query = query.where(Notification.is_read == False)
-    query = query.order_by(Notification.created_at.desc()).offset(skip).limit(limit)
+    if cursor is not None:
+        last_created, last_id = _decode_cursor(cursor)
+        query = query.where(
+            tuple_(Notification.created_at, Notification.id)
+            < tuple_(last_created, last_id)
+        )
+    else:
+        query = query.offset(skip)
+    query = query.order_by(
+        Notification.created_at.desc(), Notification.id.desc()
+    ).limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    rows = result.all()
+
+    # A short page means we hit the end; no cursor to hand out
+    headers = {}
+    if len(rows) == limit:
+        last = rows[-1]
+        headers["X-Next-Cursor"] = _encode_cursor(last.created_at, last.id)
+
+    # The bell dropdown polls this; between new notifications the body is
+    # byte-identical, so an ETag turns repeats into empty 304s (same
+    # pattern as the auth verify endpoint)
+    body = orjson.dumps([dict(row._mapping) for row in rows])
+    headers["ETag"] = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/unread-count", response_model=UnreadCountResponse)
 async def get_unread_count(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db_read),
     current_player: Player = Depends(get_current_player),
 ):
     """Get count of unread notifications (for bell badge)."""
-    result = await db.execute(
-        select(func.count(Notification.id)).where(
-            and_(
-                Notification.player_id == current_player.id,
-                Notification.is_read == False,
-            )
-        )
-    )
+    # Bare count() + is_(False) keeps this answerable from the partial
+    # unread index alone
+    result = await db.execute(_UNREAD_COUNT_STMT, {"player_id": current_player.id})
     count = result.scalar() or 0
+
+    # Clients poll this on an interval and the answer rarely changes; the
+    # count itself is the state, so it doubles as the ETag and unchanged
+    # polls cost a 304 with no body
+    etag = f'"{count}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return UnreadCountResponse(count=count)
 
 
@@ -70,18 +174,16 @@ async def mark_read(
     current_player: Player = Depends(get_current_player),
 ):
     """Mark a single notification as read."""
+    # One UPDATE ... RETURNING enforces ownership and hands back the row,
+    # replacing the SELECT + mutate + refresh round-trips
     result = await db.execute(
-        select(Notification).where(
-            Notification.id == notification_id,
-            Notification.player_id == current_player.id,
-        )
+        _MARK_READ_STMT,
+        {"b_notification_id": notification_id, "b_player_id": current_player.id},
     )
     notification = result.scalar_one_or_none()
     if not notification:
         raise HTTPException(status_code=404, detail="Notification not found")
-    notification.is_read = True
     await db.commit()
-    await db.refresh(notification)
     return notification
 
 
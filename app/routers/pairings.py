@@ -1,11 +1,14 @@
+import asyncio
+from collections import defaultdict
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, update, and_
 from sqlalchemy.orm import selectinload
 from typing import List, Optional
 from datetime import datetime
 
-from app.database import get_db
+from app.database import get_db, get_db_read
 from app.models.player import Player
 from app.models.tournament import Tournament, TournamentPlayer, TournamentStatus, TournamentFormat
 from app.models.pairing import Pairing, GameResult
@@ -40,6 +43,14 @@ from app.services.swiss import SwissPairingEngine, SwissPlayer, RoundRobinEngine
 
 router = APIRouter(prefix="/api/tournaments", tags=["Pairings"])
 
+# Loader options for any pairing query that feeds build_pairing_response:
+# both players arrive in one extra SELECT apiece for the whole result set
+# instead of two SELECTs per pairing
+_PAIRING_PLAYERS = (
+    selectinload(Pairing.white_player),
+    selectinload(Pairing.black_player),
+)
+
 
 async def get_player_brief(db: AsyncSession, player_id: str) -> Optional[PlayerBrief]:
     """Helper to get brief player info"""
@@ -47,6 +58,13 @@ async def get_player_brief(db: AsyncSession, player_id: str) -> Optional[PlayerB
         return None
     result = await db.execute(select(Player).where(Player.id == player_id))
     player = result.scalar_one_or_none()
+    if not player:
+        return None
+    return _player_brief(player)
+
+
+def _player_brief(player: Optional[Player]) -> Optional[PlayerBrief]:
+    """Brief player info from an already-loaded Player row"""
     if not player:
         return None
     return PlayerBrief(
@@ -57,10 +75,15 @@ async def get_player_brief(db: AsyncSession, player_id: str) -> Optional[PlayerB
     )
 
 
-async def build_pairing_response(db: AsyncSession, pairing: Pairing) -> PairingResponse:
-    """Convert Pairing model to response with player details"""
-    white_player = await get_player_brief(db, pairing.white_player_id)
-    black_player = await get_player_brief(db, pairing.black_player_id)
+def build_pairing_response(pairing: Pairing) -> PairingResponse:
+    """Convert Pairing model to response with player details.
+
+    Expects white_player/black_player to be loaded (query with
+    _PAIRING_PLAYERS); the relationships raise rather than lazy-load, so
+    a missing loader option fails loudly instead of N+1-ing quietly.
+    """
+    white_player = _player_brief(pairing.white_player)
+    black_player = _player_brief(pairing.black_player)
 
     return PairingResponse(
         id=pairing.id,
@@ -165,23 +188,25 @@ async def generate_pairings(
                 detail=f"Round Robin with {n} players requires {required_rounds} rounds. Update tournament settings."
             )
 
-    # Get previous pairings to build opponent history
+    # Get previous pairings to build opponent history. Only the two player
+    # ids matter here, so select them as plain tuples - no ORM hydration or
+    # identity-map entry per historical pairing (rounds x boards rows deep
+    # into a tournament)
     result = await db.execute(
-        select(Pairing).where(
+        select(Pairing.white_player_id, Pairing.black_player_id).where(
             Pairing.tournament_id == tournament_id,
             Pairing.result != GameResult.BYE
         )
     )
-    previous_pairings = result.scalars().all()
 
-    # Build opponent sets for each player
-    opponents_map = {tp.player_id: set() for tp in tournament_players}
-    for p in previous_pairings:
-        if p.white_player_id and p.black_player_id:
-            if p.white_player_id in opponents_map:
-                opponents_map[p.white_player_id].add(p.black_player_id)
-            if p.black_player_id in opponents_map:
-                opponents_map[p.black_player_id].add(p.white_player_id)
+    # Build opponent sets for each player - sets materialize on first use,
+    # so players who never played (or have withdrawn) cost nothing and the
+    # membership guards go away
+    opponents_map = defaultdict(set)
+    for white_id, black_id in result.all():
+        if white_id and black_id:
+            opponents_map[white_id].add(black_id)
+            opponents_map[black_id].add(white_id)
 
     # Build player objects for pairing engines
     pairing_players = []
@@ -192,7 +217,7 @@ async def generate_pairings(
             rating=tp.seed_rating,
             games_as_white=tp.games_as_white,
             games_as_black=tp.games_as_black,
-            opponents=opponents_map.get(tp.player_id, set()),
+            opponents=opponents_map[tp.player_id],
             is_withdrawn=tp.is_withdrawn
         ))
 
@@ -207,6 +232,7 @@ async def generate_pairings(
 
     # Create Pairing records
     created_pairings = []
+    bye_player_ids = []
     deadline = datetime.utcnow() + timedelta(hours=PAIRING_DEADLINE_HOURS)
 
     for sp in new_pairings:
@@ -220,39 +246,55 @@ async def generate_pairings(
             deadline=None if sp.is_bye else deadline  # No deadline for byes
         )
 
-        # If bye, automatically give the player a win (1 point)
-        if sp.is_bye:
-            # Update player's score for bye
-            result = await db.execute(
-                select(TournamentPlayer).where(
-                    TournamentPlayer.tournament_id == tournament_id,
-                    TournamentPlayer.player_id == sp.white_id
-                )
-            )
-            tp = result.scalar_one_or_none()
-            if tp:
-                tp.score += 1.0
-                tp.wins += 1
+        if sp.is_bye and sp.white_id:
+            bye_player_ids.append(sp.white_id)
 
         db.add(pairing)
         created_pairings.append(pairing)
 
+    # Byes automatically score a win (1 point) - one bulk UPDATE for all of
+    # them instead of loading each TournamentPlayer row inside the loop
+    if bye_player_ids:
+        await db.execute(
+            update(TournamentPlayer)
+            .where(
+                TournamentPlayer.tournament_id == tournament_id,
+                TournamentPlayer.player_id.in_(bye_player_ids)
+            )
+            .values(
+                score=TournamentPlayer.score + 1.0,
+                wins=TournamentPlayer.wins + 1
+            )
+        )
+
     # Update tournament round
     tournament.current_round = next_round
     await db.commit()
 
-    # Refresh and build responses
-    responses = []
-    for p in created_pairings:
-        await db.refresh(p)
-        responses.append(await build_pairing_response(db, p))
-
-    # Send WebSocket and Push notifications for each pairing
-    push_tokens = []
+    # Re-select the round with both players attached - one query replaces
+    # the per-pairing refresh, and the identity map hands back the same
+    # objects the notification loop below uses
+    result = await db.execute(
+        select(Pairing)
+        .options(*_PAIRING_PLAYERS)
+        .where(
+            Pairing.tournament_id == tournament_id,
+            Pairing.round_number == next_round,
+        )
+        .order_by(Pairing.board_number)
+    )
+    created_pairings = result.scalars().all()
+    responses = [build_pairing_response(p) for p in created_pairings]
+
+    # WebSocket and Push notifications don't touch the session, so they're
+    # collected here and dispatched in one gather below instead of awaiting
+    # each network round-trip in turn. The in-app notifications stay inline:
+    # create_notification only does db.add() on the shared session.
+    io_tasks = []
     for p in created_pairings:
         if not p.is_bye and p.white_player_id and p.black_player_id:
             # WebSocket notification
-            await notify_pairing_created(
+            io_tasks.append(notify_pairing_created(
                 tournament_id=tournament_id,
                 white_player_id=p.white_player_id,
                 black_player_id=p.black_player_id,
@@ -262,19 +304,20 @@ async def generate_pairings(
                     "board": p.board_number,
                     "deadline": p.deadline.isoformat() if p.deadline else None
                 }
-            )
+            ))
 
-            # Push notifications - get player info
-            import json
-            white_result = await db.execute(select(Player).where(Player.id == p.white_player_id))
-            white_player = white_result.scalar_one_or_none()
-            black_result = await db.execute(select(Player).where(Player.id == p.black_player_id))
-            black_player = black_result.scalar_one_or_none()
+            # Push notifications - both players were eager-loaded with the
+            # round re-select above, so no per-pairing lookups
+            white_player = p.white_player
+            black_player = p.black_player
 
             if white_player and white_player.push_subscription and white_player.push_enabled:
                 try:
                     subscription = json.loads(white_player.push_subscription)
-                    await notify_pairing_push(
+                except json.JSONDecodeError:
+                    pass
+                else:
+                    io_tasks.append(notify_pairing_push(
                         subscription=subscription,
                         opponent_username=black_player.chess_com_username if black_player else "Unknown",
                         tournament_name=tournament.name,
@@ -282,14 +325,15 @@ async def generate_pairings(
                         round_number=p.round_number,
                         tournament_id=tournament_id,
                         pairing_id=p.id
-                    )
-                except json.JSONDecodeError:
-                    pass
+                    ))
 
             if black_player and black_player.push_subscription and black_player.push_enabled:
                 try:
                     subscription = json.loads(black_player.push_subscription)
-                    await notify_pairing_push(
+                except json.JSONDecodeError:
+                    pass
+                else:
+                    io_tasks.append(notify_pairing_push(
                         subscription=subscription,
                         opponent_username=white_player.chess_com_username if white_player else "Unknown",
                         tournament_name=tournament.name,
@@ -297,9 +341,7 @@ async def generate_pairings(
                         round_number=p.round_number,
                         tournament_id=tournament_id,
                         pairing_id=p.id
-                    )
-                except json.JSONDecodeError:
-                    pass
+                    ))
 
             # In-app notifications for both players
             white_opponent_name = black_player.chess_com_username if black_player else "Unknown"
@@ -328,6 +370,11 @@ async def generate_pairings(
                     black_data,
                 )
 
+    if io_tasks:
+        # One dead push endpoint or dropped socket must not sink the rest
+        # of the fan-out (or the request), hence return_exceptions
+        await asyncio.gather(*io_tasks, return_exceptions=True)
+
     await db.commit()
 
     # Notify all players in tournament that new round started (WebSocket)
@@ -340,10 +387,14 @@ async def generate_pairings(
 async def get_tournament_pairings(
     tournament_id: str,
     round_number: Optional[int] = None,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_read)
 ):
     """Get pairings for a tournament, optionally filtered by round"""
-    query = select(Pairing).where(Pairing.tournament_id == tournament_id)
+    query = (
+        select(Pairing)
+        .options(*_PAIRING_PLAYERS)
+        .where(Pairing.tournament_id == tournament_id)
+    )
 
     if round_number:
         query = query.where(Pairing.round_number == round_number)
@@ -353,22 +404,20 @@ async def get_tournament_pairings(
     result = await db.execute(query)
     pairings = result.scalars().all()
 
-    responses = []
-    for p in pairings:
-        responses.append(await build_pairing_response(db, p))
-
-    return responses
+    return [build_pairing_response(p) for p in pairings]
 
 
 @router.get("/{tournament_id}/pairings/{pairing_id}", response_model=PairingResponse)
 async def get_pairing(
     tournament_id: str,
     pairing_id: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_read)
 ):
     """Get a specific pairing"""
     result = await db.execute(
-        select(Pairing).where(
+        select(Pairing)
+        .options(*_PAIRING_PLAYERS)
+        .where(
             Pairing.id == pairing_id,
             Pairing.tournament_id == tournament_id
         )
@@ -378,7 +427,7 @@ async def get_pairing(
     if not pairing:
         raise HTTPException(status_code=404, detail="Pairing not found")
 
-    return await build_pairing_response(db, pairing)
+    return build_pairing_response(pairing)
 
 
 @router.patch("/{tournament_id}/pairings/{pairing_id}/result", response_model=PairingResponse)
@@ -395,7 +444,9 @@ async def update_pairing_result(
     """
     # Get pairing
     result = await db.execute(
-        select(Pairing).where(
+        select(Pairing)
+        .options(*_PAIRING_PLAYERS)
+        .where(
             Pairing.id == pairing_id,
             Pairing.tournament_id == tournament_id
         )
@@ -424,8 +475,9 @@ async def update_pairing_result(
     # Update player scores
     await _update_player_scores(db, tournament_id, pairing)
 
+    # No refresh: the session wrote these values itself and the response
+    # doesn't include anything the database generates
     await db.commit()
-    await db.refresh(pairing)
 
     # Send WebSocket notifications
     result_str = result_data.result.value if hasattr(result_data.result, 'value') else str(result_data.result)
@@ -438,7 +490,29 @@ async def update_pairing_result(
     )
     await notify_standings_updated(tournament_id)
 
-    return await build_pairing_response(db, pairing)
+    return build_pairing_response(pairing)
+
+
+# Per-side (score, wins, draws, losses, games_as_white, games_as_black)
+# deltas keyed by result - data instead of a six-way elif chain, so
+# dispatch is one dict lookup and a new result is a new row, not a new
+# branch. Forfeited games deliberately don't count toward color balance.
+_SCORE_FIELDS = ("score", "wins", "draws", "losses", "games_as_white", "games_as_black")
+_SCORE_DELTAS = {
+    GameResult.WHITE_WINS: ((1.0, 1, 0, 0, 1, 0), (0.0, 0, 0, 1, 0, 1)),
+    GameResult.BLACK_WINS: ((0.0, 0, 0, 1, 1, 0), (1.0, 1, 0, 0, 0, 1)),
+    GameResult.DRAW: ((0.5, 0, 1, 0, 1, 0), (0.5, 0, 1, 0, 0, 1)),
+    GameResult.WHITE_FORFEIT: ((0.0, 0, 0, 1, 0, 0), (1.0, 1, 0, 0, 0, 0)),
+    GameResult.BLACK_FORFEIT: ((1.0, 1, 0, 0, 0, 0), (0.0, 0, 0, 1, 0, 0)),
+    GameResult.DOUBLE_FORFEIT: ((0.0, 0, 0, 1, 0, 0), (0.0, 0, 0, 1, 0, 0)),
+}
+
+
+def _apply_score_deltas(tp: TournamentPlayer, deltas: tuple) -> None:
+    # Skip zero deltas so untouched columns stay out of the flush UPDATE
+    for field, delta in zip(_SCORE_FIELDS, deltas):
+        if delta:
+            setattr(tp, field, getattr(tp, field) + delta)
 
 
 async def _update_player_scores(db: AsyncSession, tournament_id: str, pairing: Pairing):
@@ -446,77 +520,36 @@ async def _update_player_scores(db: AsyncSession, tournament_id: str, pairing: P
     if pairing.is_bye:
         return
 
-    # Get tournament players
+    # An unfinished or unknown result has no deltas - bail before querying
+    deltas = _SCORE_DELTAS.get(pairing.result)
+    if not deltas:
+        return
+
+    # Both sides come back in one IN query - this runs on every result
+    # submission, so don't pay two round-trips for two rows
     white_tp = None
     black_tp = None
 
-    if pairing.white_player_id:
-        result = await db.execute(
-            select(TournamentPlayer).where(
-                TournamentPlayer.tournament_id == tournament_id,
-                TournamentPlayer.player_id == pairing.white_player_id
-            )
+    player_ids = [
+        pid for pid in (pairing.white_player_id, pairing.black_player_id) if pid
+    ]
+    result = await db.execute(
+        select(TournamentPlayer).where(
+            TournamentPlayer.tournament_id == tournament_id,
+            TournamentPlayer.player_id.in_(player_ids)
         )
-        white_tp = result.scalar_one_or_none()
+    )
+    for tp in result.scalars():
+        if tp.player_id == pairing.white_player_id:
+            white_tp = tp
+        else:
+            black_tp = tp
 
-    if pairing.black_player_id:
-        result = await db.execute(
-            select(TournamentPlayer).where(
-                TournamentPlayer.tournament_id == tournament_id,
-                TournamentPlayer.player_id == pairing.black_player_id
-            )
-        )
-        black_tp = result.scalar_one_or_none()
-
-    # Update based on result
-    if pairing.result == GameResult.WHITE_WINS:
-        if white_tp:
-            white_tp.score += 1.0
-            white_tp.wins += 1
-            white_tp.games_as_white += 1
-        if black_tp:
-            black_tp.losses += 1
-            black_tp.games_as_black += 1
-
-    elif pairing.result == GameResult.BLACK_WINS:
-        if black_tp:
-            black_tp.score += 1.0
-            black_tp.wins += 1
-            black_tp.games_as_black += 1
-        if white_tp:
-            white_tp.losses += 1
-            white_tp.games_as_white += 1
-
-    elif pairing.result == GameResult.DRAW:
-        if white_tp:
-            white_tp.score += 0.5
-            white_tp.draws += 1
-            white_tp.games_as_white += 1
-        if black_tp:
-            black_tp.score += 0.5
-            black_tp.draws += 1
-            black_tp.games_as_black += 1
-
-    elif pairing.result == GameResult.WHITE_FORFEIT:
-        if black_tp:
-            black_tp.score += 1.0
-            black_tp.wins += 1
-        if white_tp:
-            white_tp.losses += 1
-
-    elif pairing.result == GameResult.BLACK_FORFEIT:
-        if white_tp:
-            white_tp.score += 1.0
-            white_tp.wins += 1
-        if black_tp:
-            black_tp.losses += 1
-
-    elif pairing.result == GameResult.DOUBLE_FORFEIT:
-        # Both players lose, neither gets points
-        if white_tp:
-            white_tp.losses += 1
-        if black_tp:
-            black_tp.losses += 1
+    white_deltas, black_deltas = deltas
+    if white_tp:
+        _apply_score_deltas(white_tp, white_deltas)
+    if black_tp:
+        _apply_score_deltas(black_tp, black_deltas)
 
 
 @router.post("/{tournament_id}/pairings/{pairing_id}/submit-game", response_model=GameVerificationResult)
@@ -537,9 +570,11 @@ async def submit_game_url(
     3. Verify the game was played after the pairing was created
     4. Automatically record the result
     """
-    # Get pairing
+    # Get pairing with both players attached
     result = await db.execute(
-        select(Pairing).where(
+        select(Pairing)
+        .options(*_PAIRING_PLAYERS)
+        .where(
             Pairing.id == pairing_id,
             Pairing.tournament_id == tournament_id
         )
@@ -561,16 +596,8 @@ async def submit_game_url(
     if pairing.result not in [GameResult.PENDING]:
         raise HTTPException(status_code=400, detail="Result already recorded for this pairing")
 
-    # Get player usernames
-    white_player = await db.execute(
-        select(Player).where(Player.id == pairing.white_player_id)
-    )
-    white_player = white_player.scalar_one_or_none()
-
-    black_player = await db.execute(
-        select(Player).where(Player.id == pairing.black_player_id)
-    )
-    black_player = black_player.scalar_one_or_none()
+    white_player = pairing.white_player
+    black_player = pairing.black_player
 
     if not white_player or not black_player:
         raise HTTPException(status_code=400, detail="Could not find players for this pairing")
@@ -638,12 +665,14 @@ async def submit_game_url(
 @router.get("/{tournament_id}/my-pairings", response_model=List[PairingResponse])
 async def get_my_pairings(
     tournament_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     current_player: Player = Depends(get_current_player)
 ):
     """Get all pairings for the current player in a tournament"""
     result = await db.execute(
-        select(Pairing).where(
+        select(Pairing)
+        .options(*_PAIRING_PLAYERS)
+        .where(
             Pairing.tournament_id == tournament_id,
             (Pairing.white_player_id == current_player.id) |
             (Pairing.black_player_id == current_player.id)
@@ -651,17 +680,13 @@ async def get_my_pairings(
     )
     pairings = result.scalars().all()
 
-    responses = []
-    for p in pairings:
-        responses.append(await build_pairing_response(db, p))
-
-    return responses
+    return [build_pairing_response(p) for p in pairings]
 
 
 @router.get("/{tournament_id}/current-round", response_model=List[PairingResponse])
 async def get_current_round_pairings(
     tournament_id: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_read)
 ):
     """Get pairings for the current round"""
     # Get tournament
@@ -677,18 +702,16 @@ async def get_current_round_pairings(
         return []
 
     result = await db.execute(
-        select(Pairing).where(
+        select(Pairing)
+        .options(*_PAIRING_PLAYERS)
+        .where(
             Pairing.tournament_id == tournament_id,
             Pairing.round_number == tournament.current_round
         ).order_by(Pairing.board_number)
     )
     pairings = result.scalars().all()
 
-    responses = []
-    for p in pairings:
-        responses.append(await build_pairing_response(db, p))
-
-    return responses
+    return [build_pairing_response(p) for p in pairings]
 
 
 @router.post("/{tournament_id}/pairings/{pairing_id}/claim-no-show")
@@ -704,9 +727,11 @@ async def claim_opponent_no_show(
 
     If opponent doesn't submit a game URL by the deadline, they will be forfeited.
     """
-    # Get pairing
+    # Get pairing with both players attached
     result = await db.execute(
-        select(Pairing).where(
+        select(Pairing)
+        .options(*_PAIRING_PLAYERS)
+        .where(
             Pairing.id == pairing_id,
             Pairing.tournament_id == tournament_id
         )
@@ -743,7 +768,8 @@ async def claim_opponent_no_show(
 
     await db.commit()
 
-    # Notify the accused player via WebSocket
+    # Notify the accused player via WebSocket - already loaded on the pairing
+    accused_player = pairing.black_player if is_white else pairing.white_player
     accused_player_id = pairing.black_player_id if is_white else pairing.white_player_id
     await notify_no_show_claimed(
         tournament_id=tournament_id,
@@ -752,17 +778,13 @@ async def claim_opponent_no_show(
         accused_player_id=accused_player_id
     )
 
-    # Send push notification to accused player
-    import json
-    result = await db.execute(select(Player).where(Player.id == accused_player_id))
-    accused_player = result.scalar_one_or_none()
+    # One tournament fetch serves both the push and in-app notifications
+    t_result = await db.execute(select(Tournament).where(Tournament.id == tournament_id))
+    tournament = t_result.scalar_one_or_none()
+    tournament_name = tournament.name if tournament else "Tournament"
 
+    # Send push notification to accused player
     if accused_player and accused_player.push_subscription and accused_player.push_enabled:
-        # Get tournament name
-        t_result = await db.execute(select(Tournament).where(Tournament.id == tournament_id))
-        tournament = t_result.scalar_one_or_none()
-        tournament_name = tournament.name if tournament else "Tournament"
-
         try:
             subscription = json.loads(accused_player.push_subscription)
             await notify_no_show_push(
@@ -775,12 +797,10 @@ async def claim_opponent_no_show(
             pass
 
     # In-app notification to accused player
-    t_result2 = await db.execute(select(Tournament).where(Tournament.id == tournament_id))
-    tournament_obj = t_result2.scalar_one_or_none()
     await create_notification(
         db, accused_player_id, "no_show",
         "No-Show Claimed",
-        f"{current_player.chess_com_username} claims you didn't show up in {tournament_obj.name if tournament_obj else 'a tournament'}. Submit game URL to dispute.",
+        f"{current_player.chess_com_username} claims you didn't show up in {tournament_name if tournament else 'a tournament'}. Submit game URL to dispute.",
         {"tournament_id": tournament_id, "pairing_id": pairing_id},
     )
     await db.commit()
@@ -871,7 +891,7 @@ async def process_expired_deadlines(
             pairing_id=pairing.id,
             white_player_id=pairing.white_player_id,
             black_player_id=pairing.black_player_id,
-            result=pairing.result.value
+            result=str(pairing.result)
         )
 
     await db.commit()
@@ -891,7 +911,7 @@ async def process_expired_deadlines(
 @router.get("/{tournament_id}/expired-pairings")
 async def get_expired_pairings(
     tournament_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     _: Player = Depends(get_current_admin)
 ):
     """
@@ -984,7 +1004,9 @@ async def claim_result(
 
     # Get pairing
     result = await db.execute(
-        select(Pairing).where(Pairing.id == pairing_id, Pairing.tournament_id == tournament_id)
+        select(Pairing)
+        .options(*_PAIRING_PLAYERS)
+        .where(Pairing.id == pairing_id, Pairing.tournament_id == tournament_id)
     )
     pairing = result.scalar_one_or_none()
 
@@ -1021,14 +1043,10 @@ async def claim_result(
     pairing.confirmation_deadline = now + timedelta(minutes=tournament.result_confirmation_minutes)
 
     await db.commit()
-    await db.refresh(pairing)
 
-    # Determine opponent
+    # Opponent is already loaded on the pairing
     opponent_id = pairing.black_player_id if is_white else pairing.white_player_id
-
-    # Get opponent for notifications
-    result = await db.execute(select(Player).where(Player.id == opponent_id))
-    opponent = result.scalar_one_or_none()
+    opponent = pairing.black_player if is_white else pairing.white_player
 
     # Send WebSocket notification to opponent
     await notify_result_claimed(
@@ -1065,7 +1083,7 @@ async def claim_result(
     )
     await db.commit()
 
-    return await build_pairing_response(db, pairing)
+    return build_pairing_response(pairing)
 
 
 @router.post("/{tournament_id}/pairings/{pairing_id}/confirm", response_model=PairingResponse)
@@ -1083,7 +1101,9 @@ async def confirm_result(
     """
     # Get pairing
     result = await db.execute(
-        select(Pairing).where(Pairing.id == pairing_id, Pairing.tournament_id == tournament_id)
+        select(Pairing)
+        .options(*_PAIRING_PLAYERS)
+        .where(Pairing.id == pairing_id, Pairing.tournament_id == tournament_id)
     )
     pairing = result.scalar_one_or_none()
 
@@ -1115,11 +1135,13 @@ async def confirm_result(
     await _update_player_scores(db, tournament_id, pairing)
 
     await db.commit()
-    await db.refresh(pairing)
 
-    # Get claimer for notifications
-    result = await db.execute(select(Player).where(Player.id == pairing.claimed_by))
-    claimer = result.scalar_one_or_none()
+    # The claimer is one of the two already-loaded players
+    claimer = (
+        pairing.white_player
+        if pairing.claimed_by == pairing.white_player_id
+        else pairing.black_player
+    )
 
     # Get tournament name
     result = await db.execute(select(Tournament).where(Tournament.id == tournament_id))
@@ -1131,7 +1153,7 @@ async def confirm_result(
         pairing_id=pairing_id,
         claimer_id=pairing.claimed_by,
         confirmer_id=current_player.id,
-        final_result=pairing.result.value
+        final_result=str(pairing.result)
     )
 
     # Send push notification to claimer
@@ -1141,7 +1163,7 @@ async def confirm_result(
             await notify_result_confirmed_push(
                 subscription=subscription,
                 confirmer_username=current_player.chess_com_username,
-                result=pairing.result.value,
+                result=str(pairing.result),
                 tournament_name=tournament.name if tournament else "Tournament",
                 tournament_id=tournament_id
             )
@@ -1152,12 +1174,12 @@ async def confirm_result(
     await create_notification(
         db, pairing.claimed_by, "confirm",
         "Result Confirmed",
-        f"{current_player.chess_com_username} confirmed {pairing.result.value} in {tournament.name if tournament else 'a tournament'}.",
+        f"{current_player.chess_com_username} confirmed {pairing.result} in {tournament.name if tournament else 'a tournament'}.",
         {"tournament_id": tournament_id, "pairing_id": pairing_id},
     )
     await db.commit()
 
-    return await build_pairing_response(db, pairing)
+    return build_pairing_response(pairing)
 
 
 @router.post("/{tournament_id}/pairings/{pairing_id}/dispute", response_model=PairingResponse)
@@ -1176,7 +1198,9 @@ async def dispute_result(
     """
     # Get pairing
     result = await db.execute(
-        select(Pairing).where(Pairing.id == pairing_id, Pairing.tournament_id == tournament_id)
+        select(Pairing)
+        .options(*_PAIRING_PLAYERS)
+        .where(Pairing.id == pairing_id, Pairing.tournament_id == tournament_id)
     )
     pairing = result.scalar_one_or_none()
 
@@ -1202,18 +1226,20 @@ async def dispute_result(
     pairing.dispute_reason = dispute.reason
 
     await db.commit()
-    await db.refresh(pairing)
 
-    # Get claimer and tournament for notifications
-    result = await db.execute(select(Player).where(Player.id == pairing.claimed_by))
-    claimer = result.scalar_one_or_none()
+    # Claimer and board players are already loaded on the pairing
+    claimer = (
+        pairing.white_player
+        if pairing.claimed_by == pairing.white_player_id
+        else pairing.black_player
+    )
 
     result = await db.execute(select(Tournament).where(Tournament.id == tournament_id))
     tournament = result.scalar_one_or_none()
 
-    # Get player names for admin notification
-    white_player = await get_player_brief(db, pairing.white_player_id)
-    black_player = await get_player_brief(db, pairing.black_player_id)
+    # Player names for admin notification
+    white_player = _player_brief(pairing.white_player)
+    black_player = _player_brief(pairing.black_player)
 
     # Send WebSocket notification to claimer
     await notify_result_dispute(
@@ -1269,7 +1295,7 @@ async def dispute_result(
     )
     await db.commit()
 
-    return await build_pairing_response(db, pairing)
+    return build_pairing_response(pairing)
 
 
 @router.post("/{tournament_id}/pairings/{pairing_id}/cancel-claim", response_model=PairingResponse)
@@ -1287,7 +1313,9 @@ async def cancel_claim(
     """
     # Get pairing
     result = await db.execute(
-        select(Pairing).where(Pairing.id == pairing_id, Pairing.tournament_id == tournament_id)
+        select(Pairing)
+        .options(*_PAIRING_PLAYERS)
+        .where(Pairing.id == pairing_id, Pairing.tournament_id == tournament_id)
     )
     pairing = result.scalar_one_or_none()
 
@@ -1323,7 +1351,6 @@ async def cancel_claim(
     pairing.confirmation_deadline = None
 
     await db.commit()
-    await db.refresh(pairing)
 
     # Notify opponent that claim was cancelled
     if opponent_id:
@@ -1333,13 +1360,13 @@ async def cancel_claim(
             opponent_id=opponent_id
         )
 
-    return await build_pairing_response(db, pairing)
+    return build_pairing_response(pairing)
 
 
 @router.get("/{tournament_id}/pending-confirmations", response_model=List[PendingConfirmationResponse])
 async def get_pending_confirmations(
     tournament_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     _: Player = Depends(get_current_admin)
 ):
     """
@@ -1357,11 +1384,16 @@ async def get_pending_confirmations(
     if not tournament:
         raise HTTPException(status_code=404, detail="Tournament not found")
 
-    # Get pairings with pending claims
+    # Get pairings with pending claims. The is_disputed filter matches the
+    # has_pending_claim definition (disputed claims live under
+    # /disputed-results) and, together with the claimed_result one, is the
+    # exact predicate of the ix_pairings_claimed partial index - without it
+    # the planner cannot prove the index covers the query
     result = await db.execute(
         select(Pairing).where(
             Pairing.tournament_id == tournament_id,
             Pairing.claimed_result != None,
+            Pairing.is_disputed == False,
             Pairing.result == GameResult.PENDING
         ).order_by(Pairing.round_number, Pairing.board_number)
     )
@@ -1399,7 +1431,7 @@ async def get_pending_confirmations(
 @router.get("/{tournament_id}/disputed-results")
 async def get_disputed_results(
     tournament_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     _: Player = Depends(get_current_admin)
 ):
     """
@@ -1430,7 +1462,7 @@ async def get_disputed_results(
             "board_number": pairing.board_number,
             "white_player": white_player.dict() if white_player else None,
             "black_player": black_player.dict() if black_player else None,
-            "claimed_result": pairing.claimed_result.value if pairing.claimed_result else None,
+            "claimed_result": str(pairing.claimed_result) if pairing.claimed_result else None,
             "claimed_by": pairing.claimed_by,
             "claimed_by_username": claimer.chess_com_username if claimer else "Unknown",
             "dispute_reason": pairing.dispute_reason,
@@ -1463,7 +1495,9 @@ async def admin_override_result(
     """
     # Get pairing
     result = await db.execute(
-        select(Pairing).where(Pairing.id == pairing_id, Pairing.tournament_id == tournament_id)
+        select(Pairing)
+        .options(*_PAIRING_PLAYERS)
+        .where(Pairing.id == pairing_id, Pairing.tournament_id == tournament_id)
     )
     pairing = result.scalar_one_or_none()
 
@@ -1495,7 +1529,6 @@ async def admin_override_result(
         await _update_player_scores(db, tournament_id, pairing)
 
     await db.commit()
-    await db.refresh(pairing)
 
     # Notify both players
     await notify_result_submitted(
@@ -1503,13 +1536,13 @@ async def admin_override_result(
         pairing_id=pairing_id,
         white_player_id=pairing.white_player_id,
         black_player_id=pairing.black_player_id,
-        result=pairing.result.value
+        result=str(pairing.result)
     )
 
     # Update standings
     await notify_standings_updated(tournament_id)
 
-    return await build_pairing_response(db, pairing)
+    return build_pairing_response(pairing)
 
 
 # ============================================================================
@@ -4,7 +4,7 @@ from sqlalchemy import select, func
 from sqlalchemy.orm import selectinload
 from typing import List, Optional
 
-from app.database import get_db
+from app.database import get_db, get_db_read
 from app.models.player import Player
 from app.models.tournament import Tournament, TournamentPlayer, TournamentStatus
 from app.models.pairing import Pairing, GameResult
@@ -21,7 +21,7 @@ async def get_global_leaderboard(
     county: Optional[str] = None,
     limit: int = 50,
     skip: int = 0,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_read)
 ):
     """
     Get global leaderboard - all-time player rankings.
@@ -133,7 +133,7 @@ async def get_global_leaderboard(
 async def list_players(
     skip: int = 0,
     limit: int = 50,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     _: Player = Depends(get_current_player)  # Require auth
 ):
     """List all registered players (paginated)"""
@@ -145,13 +145,13 @@ async def list_players(
         .order_by(Player.created_at.desc())
     )
     players = result.scalars().all()
-    return [PlayerResponse.model_validate(p) for p in players]
+    return [PlayerResponse.from_player(p) for p in players]
 
 
 @router.get("/{player_id}", response_model=PlayerResponse)
 async def get_player(
     player_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     _: Player = Depends(get_current_player)
 ):
     """Get a player by ID"""
@@ -166,7 +166,7 @@ async def get_player(
             detail="Player not found"
         )
 
-    return PlayerResponse.model_validate(player)
+    return PlayerResponse.from_player(player)
 
 
 @router.patch("/me", response_model=PlayerResponse)
@@ -184,7 +184,7 @@ async def update_profile(
     await db.commit()
     await db.refresh(current_player)
 
-    return PlayerResponse.model_validate(current_player)
+    return PlayerResponse.from_player(current_player)
 
 
 @router.post("/me/refresh-avatar", response_model=PlayerResponse)
@@ -201,7 +201,7 @@ async def refresh_avatar(
         await db.commit()
         await db.refresh(current_player)
 
-    return PlayerResponse.model_validate(current_player)
+    return PlayerResponse.from_player(current_player)
 
 
 @router.post("/me/refresh-ratings", response_model=PlayerResponse)
@@ -222,7 +222,7 @@ async def refresh_my_ratings(
         await db.commit()
         await db.refresh(current_player)
 
-    return PlayerResponse.model_validate(current_player)
+    return PlayerResponse.from_player(current_player)
 
 
 @router.post("/{player_id}/refresh-ratings", response_model=PlayerResponse)
@@ -250,7 +250,7 @@ async def refresh_player_ratings(
         await db.commit()
         await db.refresh(player)
 
-    return PlayerResponse.model_validate(player)
+    return PlayerResponse.from_player(player)
 
 
 @router.post("/refresh-all-ratings")
@@ -294,7 +294,7 @@ async def refresh_all_ratings(
 @router.get("/username/{username}", response_model=PlayerResponse)
 async def get_player_by_username(
     username: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     _: Player = Depends(get_current_player)
 ):
     """Get a player by Chess.com username"""
@@ -309,7 +309,7 @@ async def get_player_by_username(
             detail="Player not found"
         )
 
-    return PlayerResponse.model_validate(player)
+    return PlayerResponse.from_player(player)
 
 
 # Admin endpoints
@@ -336,7 +336,7 @@ async def toggle_admin(
     await db.commit()
     await db.refresh(player)
 
-    return PlayerResponse.model_validate(player)
+    return PlayerResponse.from_player(player)
 
 
 @router.patch("/{player_id}/deactivate", response_model=PlayerResponse)
@@ -361,7 +361,7 @@ async def deactivate_player(
     await db.commit()
     await db.refresh(player)
 
-    return PlayerResponse.model_validate(player)
+    return PlayerResponse.from_player(player)
 
 
 # Tournament History & Stats
@@ -371,7 +371,7 @@ async def get_my_tournament_history(
     status_filter: Optional[str] = None,
     skip: int = 0,
     limit: int = 20,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     current_player: Player = Depends(get_current_player)
 ):
     """
@@ -428,7 +428,7 @@ async def get_my_tournament_history(
 
 @router.get("/me/stats")
 async def get_my_stats(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     current_player: Player = Depends(get_current_player)
 ):
     """
@@ -498,15 +498,18 @@ async def get_player_tournament_history(
     player_id: str,
     skip: int = 0,
     limit: int = 20,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     _: Player = Depends(get_current_player)
 ):
     """Get another player's tournament history (public tournaments only)"""
-    # Verify player exists
-    result = await db.execute(select(Player).where(Player.id == player_id))
-    player = result.scalar_one_or_none()
+    # Only the username is serialized, so don't hydrate the whole row just
+    # to verify existence
+    result = await db.execute(
+        select(Player.chess_com_username).where(Player.id == player_id)
+    )
+    username = result.scalar_one_or_none()
 
-    if not player:
+    if not username:
         raise HTTPException(status_code=404, detail="Player not found")
 
     query = (
@@ -541,7 +544,7 @@ async def get_player_tournament_history(
 
     return {
         "player_id": player_id,
-        "chess_com_username": player.chess_com_username,
+        "chess_com_username": username,
         "count": len(history),
         "tournaments": history
     }
@@ -550,15 +553,18 @@ async def get_player_tournament_history(
 @router.get("/{player_id}/stats")
 async def get_player_stats(
     player_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     _: Player = Depends(get_current_player)
 ):
     """Get another player's statistics"""
-    # Verify player exists
-    result = await db.execute(select(Player).where(Player.id == player_id))
-    player = result.scalar_one_or_none()
+    # Only the username is serialized, so don't hydrate the whole row just
+    # to verify existence
+    result = await db.execute(
+        select(Player.chess_com_username).where(Player.id == player_id)
+    )
+    username = result.scalar_one_or_none()
 
-    if not player:
+    if not username:
         raise HTTPException(status_code=404, detail="Player not found")
 
     # Get all tournament participations
@@ -588,7 +594,7 @@ async def get_player_stats(
 
     return {
         "player_id": player_id,
-        "chess_com_username": player.chess_com_username,
+        "chess_com_username": username,
         "tournaments_played": total_tournaments,
         "games": {
             "total": total_games,
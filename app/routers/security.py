@@ -3,9 +3,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, distinct, and_, desc
 from datetime import datetime, timedelta
 from typing import Optional, List
-import json
 
-from app.database import get_db
+from app.database import get_db, get_db_read
 from app.models.player import Player
 from app.models.security import (
     LoginHistory,
@@ -35,7 +34,7 @@ router = APIRouter(prefix="/api/admin/security", tags=["Admin Security"])
 
 @router.get("/overview", response_model=SecurityOverview)
 async def get_security_overview(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     admin: Player = Depends(get_current_admin),
 ):
     """Get security dashboard overview statistics"""
@@ -156,7 +155,7 @@ async def get_security_overview(
 
 @router.get("/players", response_model=List[PlayerSecurityListItem])
 async def get_players_security_list(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     admin: Player = Depends(get_current_admin),
     search: Optional[str] = Query(None, description="Search by username"),
     flagged_only: bool = Query(False, description="Only show flagged players"),
@@ -232,7 +231,7 @@ async def get_players_security_list(
 @router.get("/players/{player_id}", response_model=PlayerSecurityProfile)
 async def get_player_security_profile(
     player_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     admin: Player = Depends(get_current_admin),
 ):
     """Get detailed security profile for a player"""
@@ -334,7 +333,7 @@ async def get_player_security_profile(
 @router.get("/players/{player_id}/logins", response_model=List[LoginHistoryResponse])
 async def get_player_login_history(
     player_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     admin: Player = Depends(get_current_admin),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
@@ -351,7 +350,7 @@ async def get_player_login_history(
 
 @router.get("/logins/suspicious", response_model=List[LoginHistoryWithPlayer])
 async def get_suspicious_logins(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     admin: Player = Depends(get_current_admin),
     min_risk_score: float = Query(40, ge=0, le=100),
     days: int = Query(7, ge=1, le=90),
@@ -383,7 +382,7 @@ async def get_suspicious_logins(
 
 @router.get("/flags", response_model=List[SecurityFlagWithPlayer])
 async def get_security_flags(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     admin: Player = Depends(get_current_admin),
     status_filter: Optional[str] = Query(None, alias="status"),
     severity: Optional[str] = Query(None),
@@ -477,7 +476,7 @@ async def update_security_flag(
 
 @router.get("/shared-devices", response_model=List[SharedDeviceAlertWithPlayers])
 async def get_shared_device_alerts(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     admin: Player = Depends(get_current_admin),
     status_filter: Optional[str] = Query(None, alias="status"),
     limit: int = Query(50, ge=1, le=100),
@@ -495,7 +494,7 @@ async def get_shared_device_alerts(
 
     response_list = []
     for alert in alerts:
-        player_ids = json.loads(alert.player_ids)
+        player_ids = alert.player_ids
 
         # Get player details
         result = await db.execute(
@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, exists
 from sqlalchemy.orm import selectinload
 from typing import List, Optional
 import json
 
-from app.database import get_db
+from app.database import get_db, get_db_read
 from app.models.player import Player
 from app.models.tournament import Tournament, TournamentPlayer, TournamentStatus, GenderRestriction
 from app.schemas.tournament import (
@@ -39,13 +39,13 @@ def tournament_to_response(tournament: Tournament, player_count: int = 0) -> Tou
         start_date=tournament.start_date,
         end_date=tournament.end_date,
         # Restrictions
-        county_restrictions=tournament.get_county_restrictions(),
+        county_restrictions=tournament.county_restrictions,
         min_rating=tournament.min_rating,
         max_rating=tournament.max_rating,
         min_age=tournament.min_age,
         max_age=tournament.max_age,
         gender_restriction=tournament.gender_restriction,
-        allowed_clubs=tournament.get_allowed_clubs(),
+        allowed_clubs=tournament.allowed_clubs,
         # Payment
         entry_fee=tournament.entry_fee,
         prize_pool=tournament.prize_pool,
@@ -84,9 +84,9 @@ async def create_tournament(
         created_by=current_player.id,
     )
 
-    # Set JSON fields
-    tournament.set_county_restrictions(tournament_data.county_restrictions)
-    tournament.set_allowed_clubs(tournament_data.allowed_clubs)
+    # JSON list columns - normalize empty lists to NULL (= unrestricted)
+    tournament.county_restrictions = tournament_data.county_restrictions or None
+    tournament.allowed_clubs = tournament_data.allowed_clubs or None
 
     db.add(tournament)
     await db.commit()
@@ -118,7 +118,7 @@ async def list_tournaments(
     # Pagination
     skip: int = 0,
     limit: int = 20,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_read)
 ):
     """
     Search and filter tournaments.
@@ -200,7 +200,7 @@ async def list_tournaments(
 
         # Check county eligibility
         if county:
-            county_list = t.get_county_restrictions()
+            county_list = t.county_restrictions
             if county_list:
                 allowed = expand_county_restrictions(county_list)
                 if county not in allowed:
@@ -225,7 +225,7 @@ async def list_tournaments(
 @router.get("/{tournament_id}", response_model=TournamentResponse)
 async def get_tournament(
     tournament_id: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_read)
 ):
     """Get tournament details"""
     result = await db.execute(
@@ -309,7 +309,7 @@ def check_eligibility(player: Player, tournament: Tournament, seed_rating: int)
         return f"Maximum rating for this tournament is {tournament.max_rating}"
 
     # Check county restrictions
-    county_list = tournament.get_county_restrictions()
+    county_list = tournament.county_restrictions
     if county_list:
         # Expand regions to counties
         allowed_counties = expand_county_restrictions(county_list)
@@ -319,7 +319,7 @@ def check_eligibility(player: Player, tournament: Tournament, seed_rating: int)
             return "Please update your profile with your county to join this tournament"
 
     # Check club restrictions
-    club_list = tournament.get_allowed_clubs()
+    club_list = tournament.allowed_clubs
     if club_list:
         if player.club and player.club not in club_list:
             return f"This tournament is restricted to clubs: {', '.join(club_list)}"
@@ -451,7 +451,7 @@ async def join_tournament(
 @router.get("/{tournament_id}/check-eligibility")
 async def check_tournament_eligibility(
     tournament_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_read),
     current_player: Player = Depends(get_current_player)
 ):
     """Check if current player is eligible to join a tournament"""
@@ -472,15 +472,17 @@ async def check_tournament_eligibility(
     # Check eligibility
     error = check_eligibility(current_player, tournament, seed_rating)
 
-    # Check if already joined
+    # Check if already joined - EXISTS needs only the index, not the row
     result = await db.execute(
-        select(TournamentPlayer).where(
-            TournamentPlayer.tournament_id == tournament_id,
-            TournamentPlayer.player_id == current_player.id,
-            TournamentPlayer.is_withdrawn == False
+        select(
+            exists().where(
+                TournamentPlayer.tournament_id == tournament_id,
+                TournamentPlayer.player_id == current_player.id,
+                TournamentPlayer.is_withdrawn == False
+            )
         )
     )
-    already_joined = result.scalar_one_or_none() is not None
+    already_joined = bool(result.scalar())
 
     return {
         "eligible": error is None,
@@ -522,7 +524,7 @@ async def withdraw_from_tournament(
 @router.get("/{tournament_id}/players", response_model=List[TournamentPlayerResponse])
 async def get_tournament_players(
     tournament_id: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_read)
 ):
     """Get all players in a tournament"""
     result = await db.execute(
@@ -555,7 +557,7 @@ async def get_tournament_players(
 @router.get("/{tournament_id}/standings", response_model=StandingsResponse)
 async def get_standings(
     tournament_id: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_read)
 ):
     """Get tournament standings (sorted by score, then tiebreakers)"""
     # Get tournament
@@ -4,7 +4,7 @@ from sqlalchemy import select, func
 from typing import List, Dict
 import math
 
-from app.database import get_db
+from app.database import get_db_read
 from app.models.player import Player
 from app.models.tournament import Tournament, TournamentStatus
 from app.utils.kenya import KENYA_COUNTIES, KENYA_REGIONS
@@ -120,7 +120,7 @@ async def calculate_rounds(format: str, player_count: int):
 
 
 @router.get("/public-stats")
-async def get_public_stats(db: AsyncSession = Depends(get_db)):
+async def get_public_stats(db: AsyncSession = Depends(get_db_read)):
     """
     Get public statistics for homepage.
     Returns player count, tournament count, county count.
@@ -181,7 +181,7 @@ async def get_public_stats(db: AsyncSession = Depends(get_db)):
 @router.get("/upcoming-tournaments")
 async def get_upcoming_tournaments(
     limit: int = 3,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_read)
 ):
     """
     Get upcoming tournaments for homepage.
@@ -3,6 +3,8 @@ from pydantic import BaseModel, Field, field_validator
 from typing import Optional
 from datetime import datetime
 
+from app.schemas.security import DeviceFingerprintData
+
 
 def normalize_kenyan_phone(phone: str) -> str:
     """
@@ -58,8 +60,10 @@ class PlayerLoginWithFingerprint(BaseModel):
     """Schema for player login with device fingerprint for security tracking"""
     chess_com_username: str
     password: str
-    # Device fingerprint data (optional but recommended)
-    fingerprint: Optional[dict] = None  # DeviceFingerprintData as dict
+    # Device fingerprint data (optional but recommended) - typed so Pydantic
+    # validates it once at request-body time instead of the handler
+    # rebuilding the model from a dict
+    fingerprint: Optional[DeviceFingerprintData] = None
 
 
 class PlayerUpdate(BaseModel):
@@ -113,6 +117,36 @@ class PlayerResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_player(cls, player) -> "PlayerResponse":
+        """
+        Build from a Player row without re-running validation.
+
+        Every value comes straight from our own players table (and FastAPI
+        validates the response model again on the way out), so the
+        model_validate pass in each handler was pure overhead.
+        """
+        return cls.model_construct(
+            id=player.id,
+            chess_com_username=player.chess_com_username,
+            chess_com_avatar=player.chess_com_avatar,
+            chess_com_joined=player.chess_com_joined,
+            chess_com_status=player.chess_com_status,
+            chess_com_country=player.chess_com_country,
+            phone=player.phone,
+            age=player.age,
+            gender=player.gender,
+            county=player.county,
+            club=player.club,
+            is_active=player.is_active,
+            is_admin=player.is_admin,
+            created_at=player.created_at,
+            rating_rapid=player.rating_rapid,
+            rating_blitz=player.rating_blitz,
+            rating_bullet=player.rating_bullet,
+            ratings_updated_at=player.ratings_updated_at,
+        )
+
 
 class Token(BaseModel):
     """JWT Token response"""
@@ -122,7 +122,7 @@ class SecurityFlagUpdate(BaseModel):
 class SharedDeviceAlertResponse(BaseModel):
     id: str
     fingerprint_hash: str
-    player_ids: str
+    player_ids: List[str]
     player_count: int
     status: str
     reviewed_by: Optional[str]
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -17,6 +18,11 @@ settings = get_settings()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Verified when a login names an unknown user, so a failed lookup costs the
+# same bcrypt work as a failed password check (no timing-based username
+# enumeration, uniform CPU per attempt). Built once at import.
+_DUMMY_PASSWORD_HASH = bcrypt.hashpw(b"!placeholder!", bcrypt.gensalt()).decode("utf-8")
+
 
 class AuthService:
     """Service for authentication operations"""
@@ -36,6 +42,30 @@ class AuthService:
         hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
         return hashed.decode('utf-8')
 
+    @staticmethod
+    async def verify_password_async(
+        plain_password: str, hashed_password: Optional[str]
+    ) -> bool:
+        """
+        Verify a password in a worker thread so the ~100ms bcrypt check
+        doesn't block the event loop. Pass hashed_password=None for an
+        unknown user: a dummy hash is verified so the attempt takes the
+        same time and CPU either way, and the result is always False.
+        """
+        if hashed_password is None:
+            await asyncio.to_thread(
+                AuthService.verify_password, plain_password, _DUMMY_PASSWORD_HASH
+            )
+            return False
+        return await asyncio.to_thread(
+            AuthService.verify_password, plain_password, hashed_password
+        )
+
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """Hash a password in a worker thread (see verify_password_async)."""
+        return await asyncio.to_thread(AuthService.hash_password, password)
+
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
         to_encode = data.copy()
@@ -93,6 +123,13 @@ async def get_current_player(
             detail="Account is deactivated"
         )
 
+    # End the lookup transaction so the session's connection (the single
+    # write-pool slot under SQLite) goes back to the pool instead of being
+    # pinned for the rest of the request. expire_on_commit=False keeps the
+    # player usable, and write handlers sharing this session just start a
+    # fresh transaction on their first statement.
+    await db.commit()
+
     return player
 
 
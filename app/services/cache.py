@@ -0,0 +1,41 @@
+"""
+Small in-process TTL cache decorator for endpoint responses.
+
+Per-process, like the analytics traffic ring - no external cache service
+in this deployment.
+"""
+import asyncio
+import functools
+import time
+
+
+def ttl_cache(seconds: int, key_params: tuple = ()):
+    """Cache an async endpoint's response in memory for a short TTL.
+
+    Keyed on the named keyword parameters; everything else (sessions,
+    request objects) is ignored. The lock keeps concurrent misses from
+    stampeding the same queries. The wrapper exposes ``cache_clear()``
+    so mutating endpoints can invalidate eagerly instead of waiting out
+    the TTL.
+    """
+    def decorator(func):
+        cache: dict = {}
+        lock = asyncio.Lock()
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = tuple(kwargs.get(p) for p in key_params)
+            hit = cache.get(key)
+            if hit and hit[0] > time.monotonic():
+                return hit[1]
+            async with lock:
+                hit = cache.get(key)
+                if hit and hit[0] > time.monotonic():
+                    return hit[1]
+                value = await func(*args, **kwargs)
+                cache[key] = (time.monotonic() + seconds, value)
+                return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
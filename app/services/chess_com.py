@@ -1,3 +1,5 @@
+import time
+
 import httpx
 from typing import Optional, List
 from pydantic import BaseModel
@@ -50,17 +52,42 @@ class ChessComGame(BaseModel):
 class ChessComService:
     """Service for interacting with Chess.com Public API"""
 
+    # Profiles barely change, yet /verify, register and every login's
+    # avatar refresh all hit this endpoint (50-500ms external call, and
+    # Chess.com rate-limits). Hot profiles are served from memory instead.
+    PROFILE_CACHE_TTL = 300.0      # found profiles
+    PROFILE_NEGATIVE_TTL = 60.0    # "no such player" answers
+    _PROFILE_CACHE_MAX = 5000
+
     def __init__(self):
         self.base_url = settings.chess_com_api_base
         self.headers = {
             "User-Agent": "ChessKenya/1.0 (contact@chesskenya.co.ke)"  # Chess.com requires User-Agent
         }
+        self._profile_cache: dict = {}
 
     async def get_player_profile(self, username: str) -> Optional[ChessComProfile]:
         """
-        Fetch player profile from Chess.com
+        Fetch player profile from Chess.com (cached for a short TTL)
         Returns None if player doesn't exist
         """
+        key = username.lower()
+        now = time.monotonic()
+        hit = self._profile_cache.get(key)
+        if hit and hit[0] > now:
+            return hit[1]
+
+        profile = await self._fetch_player_profile(username)
+
+        if len(self._profile_cache) >= self._PROFILE_CACHE_MAX:
+            self._profile_cache = {
+                k: v for k, v in self._profile_cache.items() if v[0] > now
+            }
+        ttl = self.PROFILE_CACHE_TTL if profile else self.PROFILE_NEGATIVE_TTL
+        self._profile_cache[key] = (now + ttl, profile)
+        return profile
+
+    async def _fetch_player_profile(self, username: str) -> Optional[ChessComProfile]:
         async with httpx.AsyncClient() as client:
             try:
                 response = await client.get(
@@ -0,0 +1,75 @@
+"""
+In-process sliding-window limiter for failed login attempts.
+
+The login endpoints used to answer "is this IP/account locked out?" with
+two aggregate queries against login_history on every attempt - exactly
+the path a credential-stuffing run hammers hardest. The window state is
+tiny (a handful of timestamps per offender), so it lives in process
+memory instead: checks and updates are O(window) deque operations with
+no database involvement. Counters reset on restart, which only ever
+errs on the permissive side; the attempts themselves are still persisted
+to login_history for investigation.
+"""
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+# Sweep expired keys once the table grows past this many offenders
+_SWEEP_THRESHOLD = 10_000
+
+
+class FailedLoginLimiter:
+    """Rolling-window failed-attempt counter with lockout.
+
+    A key is blocked when it has accumulated max_attempts failures within
+    window_seconds, and stays blocked until lockout_seconds after the most
+    recent failure - the same policy the old SQL implementation derived
+    from login_history.
+    """
+
+    def __init__(self, max_attempts: int, window_seconds: float, lockout_seconds: float):
+        self.max_attempts = max_attempts
+        self.window_seconds = window_seconds
+        self.lockout_seconds = lockout_seconds
+        self._failures: Dict[str, Deque[float]] = {}
+
+    def _trim(self, attempts: Deque[float], now: float) -> None:
+        cutoff = now - self.window_seconds
+        while attempts and attempts[0] < cutoff:
+            attempts.popleft()
+
+    def record_failure(self, key: str) -> None:
+        """Record one failed attempt for the key."""
+        now = time.monotonic()
+        attempts = self._failures.get(key)
+        if attempts is None:
+            if len(self._failures) >= _SWEEP_THRESHOLD:
+                self._sweep(now)
+            attempts = self._failures[key] = deque()
+        self._trim(attempts, now)
+        attempts.append(now)
+
+    def check(self, key: str) -> Tuple[bool, int, Optional[float]]:
+        """Check a key without recording an attempt.
+
+        Returns (is_blocked, remaining_attempts, retry_after_seconds).
+        """
+        attempts = self._failures.get(key)
+        if not attempts:
+            return False, self.max_attempts, None
+        now = time.monotonic()
+        self._trim(attempts, now)
+        if not attempts:
+            del self._failures[key]
+            return False, self.max_attempts, None
+        if len(attempts) >= self.max_attempts:
+            retry_after = attempts[-1] + self.lockout_seconds - now
+            if retry_after > 0:
+                return True, 0, retry_after
+        return False, max(0, self.max_attempts - len(attempts)), None
+
+    def _sweep(self, now: float) -> None:
+        """Drop keys whose failures have all aged out of the window."""
+        cutoff = now - max(self.window_seconds, self.lockout_seconds)
+        for key in [k for k, v in self._failures.items() if not v or v[-1] < cutoff]:
+            del self._failures[key]
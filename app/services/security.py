@@ -3,7 +3,8 @@ import hashlib
 from datetime import datetime, timedelta
 from typing import Optional, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_, distinct
+from sqlalchemy import select, func, and_, or_, distinct, exists, bindparam
+from sqlalchemy.dialects.sqlite import insert as sqlite_upsert
 from user_agents import parse as parse_user_agent
 
 from app.models.player import Player
@@ -14,6 +15,39 @@ from app.models.security import (
     SharedDeviceAlert,
 )
 from app.schemas.security import DeviceFingerprintData, RiskAnalysisResponse
+from app.services.ratelimit import FailedLoginLimiter
+
+# Risk-score buckets, highest threshold first - the single place to tune
+# where "medium"/"high"/"critical" start
+RISK_LEVEL_THRESHOLDS = (
+    (80, "critical"),
+    (60, "high"),
+    (40, "medium"),
+)
+
+
+def risk_level_for(risk_score: float) -> str:
+    """Map a 0-100 risk score onto its severity bucket."""
+    for threshold, level in RISK_LEVEL_THRESHOLDS:
+        if risk_score >= threshold:
+            return level
+    return "low"
+
+
+# Existence probe for usernames missing from the in-process filter;
+# index-only via the unique username index
+_USERNAME_EXISTS_STMT = select(
+    exists().where(Player.chess_com_username == bindparam("uname"))
+)
+
+
+# What analyze_risk advises per bucket
+_RECOMMENDATION_BY_LEVEL = {
+    "critical": "block",
+    "high": "challenge",
+    "medium": "challenge",
+    "low": "allow",
+}
 
 
 class SecurityService:
@@ -24,6 +58,49 @@ class SecurityService:
     LOCKOUT_DURATION_MINUTES = 15  # Lockout duration
     FAILED_ATTEMPT_WINDOW_MINUTES = 15  # Window to count failed attempts
 
+    def __init__(self):
+        # In-memory failed-login limiter (see app.services.ratelimit)
+        self.login_limiter = FailedLoginLimiter(
+            max_attempts=self.MAX_FAILED_ATTEMPTS,
+            window_seconds=self.FAILED_ATTEMPT_WINDOW_MINUTES * 60,
+            lockout_seconds=self.LOCKOUT_DURATION_MINUTES * 60,
+        )
+        # Registered usernames, loaded at startup (None until then) - lets
+        # login reject sprayed unknown usernames without a SELECT each
+        self._known_usernames: Optional[set] = None
+
+    async def load_known_usernames(self, db: AsyncSession):
+        """Fill the known-username filter from the players table."""
+        result = await db.execute(select(Player.chess_com_username))
+        self._known_usernames = set(result.scalars())
+
+    def note_registered(self, username: str):
+        """Add a freshly registered username to the filter."""
+        if self._known_usernames is not None:
+            self._known_usernames.add(username.lower())
+
+    async def is_known_username(self, db: AsyncSession, username: str) -> bool:
+        """
+        Whether a username exists. Positives are answered from memory;
+        a miss falls back to the table, because the set only sees
+        registrations made by this process - a player created by another
+        worker (or straight in the database) must not be locked out of
+        login. Rows found on fallback are absorbed into the set, so only
+        the first attempt pays the probe; sprayed unknown usernames pay
+        an index-only EXISTS each, bounded by the failed-login limiter.
+        Fails open (True) if the filter was never loaded.
+        """
+        if self._known_usernames is None:
+            return True
+        uname = username.lower()
+        if uname in self._known_usernames:
+            return True
+        result = await db.execute(_USERNAME_EXISTS_STMT, {"uname": uname})
+        if result.scalar():
+            self._known_usernames.add(uname)
+            return True
+        return False
+
     # Risk scoring weights
     RISK_NEW_DEVICE = 25
     RISK_NEW_LOCATION = 15
@@ -138,25 +215,31 @@ class SecurityService:
         self, db: AsyncSession, player_id: str, fingerprint_hash: str
     ) -> bool:
         """Check if this fingerprint is new for the player"""
+        # EXISTS answers straight from the index - no hydrating a row we
+        # only test for presence
         result = await db.execute(
-            select(DeviceFingerprint).where(
-                DeviceFingerprint.player_id == player_id,
-                DeviceFingerprint.fingerprint_hash == fingerprint_hash,
+            select(
+                exists().where(
+                    DeviceFingerprint.player_id == player_id,
+                    DeviceFingerprint.fingerprint_hash == fingerprint_hash,
+                )
             )
         )
-        return result.scalar_one_or_none() is None
+        return not result.scalar()
 
     async def _is_new_location(
         self, db: AsyncSession, player_id: str, ip_address: str
     ) -> bool:
         """Check if this IP is new for the player"""
         result = await db.execute(
-            select(LoginHistory).where(
-                LoginHistory.player_id == player_id,
-                LoginHistory.ip_address == ip_address,
-            ).limit(1)
+            select(
+                exists().where(
+                    LoginHistory.player_id == player_id,
+                    LoginHistory.ip_address == ip_address,
+                )
+            )
         )
-        return result.scalar_one_or_none() is None
+        return not result.scalar()
 
     async def _calculate_risk_score(
         self,
@@ -238,12 +321,18 @@ class SecurityService:
         from app.models.tournament import TournamentPlayer, Tournament
 
         result = await db.execute(
-            select(TournamentPlayer).join(Tournament).where(
-                TournamentPlayer.player_id == player_id,
-                Tournament.status == "active",
-            ).limit(1)
+            select(
+                exists(
+                    select(TournamentPlayer.tournament_id)
+                    .join(Tournament)
+                    .where(
+                        TournamentPlayer.player_id == player_id,
+                        Tournament.status == "active",
+                    )
+                )
+            )
         )
-        return result.scalar_one_or_none() is not None
+        return bool(result.scalar())
 
     async def _update_device_record(
         self,
@@ -255,29 +344,30 @@ class SecurityService:
         device_name: str,
         is_primary: bool = False,
     ):
-        """Update or create device fingerprint record"""
-        result = await db.execute(
-            select(DeviceFingerprint).where(
-                DeviceFingerprint.player_id == player_id,
-                DeviceFingerprint.fingerprint_hash == fingerprint_hash,
-            )
-        )
-        device = result.scalar_one_or_none()
+        """Update or create device fingerprint record.
 
-        if device:
-            device.login_count += 1
-            device.last_seen_at = datetime.utcnow()
-        else:
-            device = DeviceFingerprint(
-                player_id=player_id,
-                fingerprint_hash=fingerprint_hash,
-                device_name=device_name,
-                platform=platform,
-                browser=browser,
-                is_primary=is_primary,
-                trust_reason="registration" if is_primary else "first_use",
-            )
-            db.add(device)
+        Runs on every login, so it's a single UPSERT against the unique
+        (player_id, fingerprint_hash) index instead of a SELECT followed by
+        an UPDATE or INSERT - one statement, and no lost-update window
+        between the read and the write.
+        """
+        stmt = sqlite_upsert(DeviceFingerprint).values(
+            player_id=player_id,
+            fingerprint_hash=fingerprint_hash,
+            device_name=device_name,
+            platform=platform,
+            browser=browser,
+            is_primary=is_primary,
+            trust_reason="registration" if is_primary else "first_use",
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["player_id", "fingerprint_hash"],
+            set_={
+                "login_count": DeviceFingerprint.login_count + 1,
+                "last_seen_at": datetime.utcnow(),
+            },
+        )
+        await db.execute(stmt)
 
     async def _check_shared_device(
         self, db: AsyncSession, fingerprint_hash: str, current_player_id: str
@@ -304,15 +394,15 @@ class SecurityService:
 
         if existing_alert:
             # Update existing alert with new player count
-            existing_player_ids = set(json.loads(existing_alert.player_ids))
+            existing_player_ids = set(existing_alert.player_ids)
             existing_player_ids.update(all_players)
-            existing_alert.player_ids = json.dumps(list(existing_player_ids))
+            existing_alert.player_ids = list(existing_player_ids)
             existing_alert.player_count = len(existing_player_ids)
         else:
             # Create new alert
             alert = SharedDeviceAlert(
                 fingerprint_hash=fingerprint_hash,
-                player_ids=json.dumps(all_players),
+                player_ids=all_players,
                 player_count=len(all_players),
             )
             db.add(alert)
@@ -326,13 +416,7 @@ class SecurityService:
         risk_factors: List[str],
     ):
         """Create a security flag for high-risk login"""
-        severity = "low"
-        if risk_score >= 80:
-            severity = "critical"
-        elif risk_score >= 60:
-            severity = "high"
-        elif risk_score >= 40:
-            severity = "medium"
+        severity = risk_level_for(risk_score)
 
         flag = SecurityFlag(
             player_id=player.id,
@@ -386,17 +470,8 @@ class SecurityService:
             db, player, fingerprint_hash, ip_address, is_new_device, is_new_location
         )
 
-        risk_level = "low"
-        recommendation = "allow"
-        if risk_score >= 80:
-            risk_level = "critical"
-            recommendation = "block"
-        elif risk_score >= 60:
-            risk_level = "high"
-            recommendation = "challenge"
-        elif risk_score >= 40:
-            risk_level = "medium"
-            recommendation = "challenge"
+        risk_level = risk_level_for(risk_score)
+        recommendation = _RECOMMENDATION_BY_LEVEL[risk_level]
 
         return RiskAnalysisResponse(
             risk_score=risk_score,
@@ -471,49 +546,15 @@ class SecurityService:
         """
         Check if login attempts are rate limited.
         Returns (is_blocked, remaining_attempts, lockout_until)
-        """
-        since = datetime.utcnow() - timedelta(minutes=self.FAILED_ATTEMPT_WINDOW_MINUTES)
-
-        # Build query based on identifier type
-        if identifier_type == "ip":
-            query = select(func.count(LoginHistory.id)).where(
-                LoginHistory.ip_address == identifier,
-                LoginHistory.login_successful == False,
-                LoginHistory.created_at >= since,
-            )
-        else:  # username
-            # Join with player to get by username
-            query = select(func.count(LoginHistory.id)).join(Player).where(
-                Player.chess_com_username == identifier.lower(),
-                LoginHistory.login_successful == False,
-                LoginHistory.created_at >= since,
-            )
 
-        result = await db.execute(query)
-        failed_count = result.scalar() or 0
-
-        if failed_count >= self.MAX_FAILED_ATTEMPTS:
-            # Get the most recent failed attempt to calculate lockout end
-            if identifier_type == "ip":
-                recent_query = select(LoginHistory.created_at).where(
-                    LoginHistory.ip_address == identifier,
-                    LoginHistory.login_successful == False,
-                ).order_by(LoginHistory.created_at.desc()).limit(1)
-            else:
-                recent_query = select(LoginHistory.created_at).join(Player).where(
-                    Player.chess_com_username == identifier.lower(),
-                    LoginHistory.login_successful == False,
-                ).order_by(LoginHistory.created_at.desc()).limit(1)
-
-            result = await db.execute(recent_query)
-            last_failed = result.scalar()
-
-            if last_failed:
-                lockout_until = last_failed + timedelta(minutes=self.LOCKOUT_DURATION_MINUTES)
-                if datetime.utcnow() < lockout_until:
-                    return True, 0, lockout_until
-
-        remaining = max(0, self.MAX_FAILED_ATTEMPTS - failed_count)
+        Served from the in-memory limiter - no database round-trips on
+        the login hot path (db is kept in the signature for callers).
+        """
+        blocked, remaining, retry_after = self.login_limiter.check(
+            f"{identifier_type}:{identifier.lower()}"
+        )
+        if blocked:
+            return True, 0, datetime.utcnow() + timedelta(seconds=retry_after)
         return False, remaining, None
 
     async def record_failed_login(
@@ -524,6 +565,10 @@ class SecurityService:
         user_agent: str = "",
     ):
         """Record a failed login attempt for rate limiting"""
+        # Feed the in-memory limiter for both keys check_rate_limit uses
+        self.login_limiter.record_failure(f"ip:{ip_address.lower()}")
+        self.login_limiter.record_failure(f"username:{username.lower()}")
+
         # Try to find the player
         result = await db.execute(
             select(Player).where(Player.chess_com_username == username.lower())
@@ -7,6 +7,8 @@ Works with both Sandbox (testing) and Live (production) environments.
 Sandbox: username="sandbox", use simulator at https://simulator.africastalking.com
 Live: use your actual username and API key
 """
+import asyncio
+
 import africastalking
 from typing import Optional
 from app.config import get_settings
@@ -90,8 +92,18 @@ class SMSService:
             if self.sender_id and self.username != "sandbox":
                 kwargs["sender_id"] = self.sender_id
 
-            # Send SMS (synchronous call, but lightweight)
-            response = self.sms.send(**kwargs)
+            # The Africa's Talking client is synchronous - run it in a
+            # worker thread so the event loop isn't held for the gateway
+            # round-trip, and retry once on transient failures
+            response = None
+            for attempt in (1, 2):
+                try:
+                    response = await asyncio.to_thread(self.sms.send, **kwargs)
+                    break
+                except Exception:
+                    if attempt == 2:
+                        raise
+                    await asyncio.sleep(2)
 
             # Parse response
             recipients = response.get("SMSMessageData", {}).get("Recipients", [])
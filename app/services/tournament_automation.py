@@ -112,7 +112,7 @@ async def auto_detect_game_result(db: AsyncSession, pairing: Pairing) -> bool:
 
         logger.info(
             f"Auto-detected game: {white_player.chess_com_username} vs {black_player.chess_com_username} "
-            f"= {pairing.result.value}"
+            f"= {pairing.result}"
         )
         return True
 
@@ -20,7 +20,7 @@ os.environ["TESTING"] = "1"
 from app.config import get_settings
 get_settings.cache_clear()
 
-from app.database import Base, get_db, engine, async_session_maker
+from app.database import Base, get_db, get_db_read, engine, async_session_maker
 from app.main import app
 from app.models.player import Player
 from app.models.tournament import Tournament, TournamentPlayer, TournamentStatus, TournamentFormat
@@ -68,6 +68,9 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    # Read-only endpoints resolve their session through get_db_read; point
+    # it at the same test session so they see uncommitted fixture data
+    app.dependency_overrides[get_db_read] = override_get_db
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -8,6 +8,8 @@ Tests cover:
 - Auth guards (unauthenticated access denied)
 """
 import json
+from datetime import datetime
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -279,6 +281,82 @@ class TestNotificationsAPI:
         assert resp2.json()[0]["title"] == "For P2"
 
 
+# ============================================================================
+# Keyset cursor pagination tests
+# ============================================================================
+
+
+class TestNotificationsCursorPagination:
+    """Tests for the opaque cursor protocol (X-Next-Cursor header)."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_walks_all_pages(
+        self, client: AsyncClient, db_session: AsyncSession, test_player: Player
+    ):
+        """Test following X-Next-Cursor visits every row once, in order."""
+        for i in range(5):
+            await create_notification(db_session, test_player.id, "pairing", f"N{i}", "body")
+        await db_session.commit()
+
+        seen = []
+        cursor = None
+        for _ in range(3):
+            url = "/api/notifications?limit=2"
+            if cursor:
+                url += f"&cursor={cursor}"
+            response = await client.get(url, headers=get_auth_header(test_player))
+            assert response.status_code == 200
+            page = response.json()
+            seen.extend(n["title"] for n in page)
+            cursor = response.headers.get("x-next-cursor")
+            if len(page) < 2:
+                break
+
+        # Newest first, no duplicates, nothing skipped
+        assert seen == ["N4", "N3", "N2", "N1", "N0"]
+        # The short final page hands out no cursor
+        assert cursor is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_tie_break_on_equal_timestamps(
+        self, client: AsyncClient, db_session: AsyncSession, test_player: Player
+    ):
+        """Test rows sharing a created_at are ordered and paged by id."""
+        stamp = datetime(2026, 8, 28, 12, 0, 0)
+        for nid in ("aaa", "bbb", "ccc"):
+            db_session.add(Notification(
+                id=nid, player_id=test_player.id, type="pairing",
+                title=nid, body="body", created_at=stamp,
+            ))
+        await db_session.commit()
+
+        seen = []
+        cursor = None
+        for _ in range(3):
+            url = "/api/notifications?limit=1"
+            if cursor:
+                url += f"&cursor={cursor}"
+            response = await client.get(url, headers=get_auth_header(test_player))
+            assert response.status_code == 200
+            seen.extend(n["id"] for n in response.json())
+            cursor = response.headers.get("x-next-cursor")
+
+        assert seen == ["ccc", "bbb", "aaa"]
+
+    @pytest.mark.asyncio
+    async def test_malformed_cursor_rejected(
+        self, client: AsyncClient, test_player: Player
+    ):
+        """Test that undecodable cursors get a 400, not a 500."""
+        for bad in ("not-base64!!", "aGVsbG8td29ybGQ="):  # junk and base64'd garbage
+            response = await client.get(
+                f"/api/notifications?cursor={bad}",
+                headers=get_auth_header(test_player),
+            )
+            assert response.status_code == 400
+            assert response.json()["detail"] == "Invalid cursor"
+
+
 # ============================================================================
 # Auth guard tests
 # ============================================================================
@@ -0,0 +1,129 @@
+"""
+Tests for the password reset OTP flow.
+
+Tests cover:
+- Successful reset with a valid OTP (and login with the new password)
+- OTPs are single-use
+- Wrong codes burn attempts and lock the OTP at the cap
+- Expired OTPs are rejected
+- Unknown phone numbers are rejected without leaking existence
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.otp import OTP, MAX_OTP_ATTEMPTS
+from app.models.player import Player
+
+
+async def request_otp(client: AsyncClient, phone: str) -> str:
+    """Request a reset OTP and return the raw code (debug path, no SMS)."""
+    response = await client.post("/api/auth/request-reset", json={"phone": phone})
+    assert response.status_code == 200
+    return response.json()["_debug_otp"]
+
+
+class TestPasswordReset:
+    """Tests for /api/auth/reset-password."""
+
+    @pytest.mark.asyncio
+    async def test_reset_with_valid_otp(
+        self, client: AsyncClient, db_session: AsyncSession, test_player: Player
+    ):
+        """Test the happy path: valid OTP resets the password."""
+        otp = await request_otp(client, test_player.phone)
+
+        response = await client.post("/api/auth/reset-password", json={
+            "phone": test_player.phone,
+            "otp": otp,
+            "new_password": "brand-new-pass",
+        })
+        assert response.status_code == 200
+
+        # The new password works for login, the old one doesn't
+        login = await client.post("/api/auth/login/json", json={
+            "chess_com_username": test_player.chess_com_username,
+            "password": "brand-new-pass",
+        })
+        assert login.status_code == 200
+        old_login = await client.post("/api/auth/login/json", json={
+            "chess_com_username": test_player.chess_com_username,
+            "password": "testpass123",
+        })
+        assert old_login.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_otp_is_single_use(
+        self, client: AsyncClient, db_session: AsyncSession, test_player: Player
+    ):
+        """Test that a consumed OTP cannot reset the password again."""
+        otp = await request_otp(client, test_player.phone)
+
+        first = await client.post("/api/auth/reset-password", json={
+            "phone": test_player.phone, "otp": otp, "new_password": "first-pass",
+        })
+        assert first.status_code == 200
+
+        second = await client.post("/api/auth/reset-password", json={
+            "phone": test_player.phone, "otp": otp, "new_password": "second-pass",
+        })
+        assert second.status_code == 400
+        assert "Invalid or expired OTP" in second.json()["detail"]
+
+    @pytest.mark.asyncio
+    async def test_wrong_code_burns_attempts(
+        self, client: AsyncClient, db_session: AsyncSession, test_player: Player
+    ):
+        """Test wrong codes count down attempts and retire the OTP at the cap."""
+        otp = await request_otp(client, test_player.phone)
+        wrong = "000000" if otp != "000000" else "000001"
+
+        for attempt in range(1, MAX_OTP_ATTEMPTS + 1):
+            response = await client.post("/api/auth/reset-password", json={
+                "phone": test_player.phone, "otp": wrong, "new_password": "new-pass",
+            })
+            assert response.status_code == 400
+            if attempt < MAX_OTP_ATTEMPTS:
+                remaining = MAX_OTP_ATTEMPTS - attempt
+                assert f"{remaining} attempts remaining" in response.json()["detail"]
+            else:
+                assert "Too many failed attempts" in response.json()["detail"]
+
+        # Even the right code is dead once the OTP is retired
+        response = await client.post("/api/auth/reset-password", json={
+            "phone": test_player.phone, "otp": otp, "new_password": "new-pass",
+        })
+        assert response.status_code == 400
+        assert "Invalid or expired OTP" in response.json()["detail"]
+
+    @pytest.mark.asyncio
+    async def test_expired_otp_rejected(
+        self, client: AsyncClient, db_session: AsyncSession, test_player: Player
+    ):
+        """Test that an expired OTP cannot reset the password."""
+        otp = await request_otp(client, test_player.phone)
+
+        result = await db_session.execute(
+            select(OTP).where(OTP.phone == test_player.phone, OTP.is_used == False)
+        )
+        otp_row = result.scalar_one()
+        otp_row.expires_at = datetime.utcnow() - timedelta(minutes=1)
+        await db_session.commit()
+
+        response = await client.post("/api/auth/reset-password", json={
+            "phone": test_player.phone, "otp": otp, "new_password": "new-pass",
+        })
+        assert response.status_code == 400
+        assert "Invalid or expired OTP" in response.json()["detail"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_phone_rejected(self, client: AsyncClient):
+        """Test resetting against a phone with no account."""
+        response = await client.post("/api/auth/reset-password", json={
+            "phone": "+254799999999", "otp": "123456", "new_password": "new-pass",
+        })
+        assert response.status_code == 400
+        assert "Invalid phone number or OTP" in response.json()["detail"]